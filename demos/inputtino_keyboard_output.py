@@ -12,7 +12,8 @@ if sys.platform != "linux":
     sys.exit(1)
 
 import logging
-import time
+import signal
+import threading
 
 from pamiq_io.keyboard import InputtinoKeyboardOutput, Key
 
@@ -33,11 +34,18 @@ def main() -> None:
 
     logger.info("Starting keyboard input simulation demo")
 
+    # Waiting on an event instead of sleeping lets Ctrl+C stop the demo
+    # immediately, and the held key is still released before exiting.
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+
     # Countdown before starting
     logger.info("Starting in 5 seconds. Please focus on your target application...")
     for i in range(5, 0, -1):
         print(f"{i}...")
-        time.sleep(1)
+        if stop_event.wait(1.0):
+            logger.info("Demo interrupted by user")
+            return
 
     # Initialize the keyboard output
     keyboard = InputtinoKeyboardOutput()
@@ -45,20 +53,20 @@ def main() -> None:
     # Define the sequence of keys to press
     keys = [Key.W, Key.A, Key.S, Key.D]
 
-    try:
-        # Press each key in sequence with a 1-second delay
-        for key in keys:
-            logger.info(f"Pressing key: {key}")
-            keyboard.press(key)
-            time.sleep(1.0)  # Wait 1 second.
+    # Press each key in sequence with a 1-second delay
+    for key in keys:
+        logger.info(f"Pressing key: {key}")
+        keyboard.press(key)
+        interrupted = stop_event.wait(1.0)  # Wait 1 second.
 
-            logger.info(f"Releasing key: {key}")
-            keyboard.release(key)
+        logger.info(f"Releasing key: {key}")
+        keyboard.release(key)
 
-        logger.info("Keyboard input simulation completed")
+        if interrupted:
+            logger.info("Demo interrupted by user")
+            return
 
-    except KeyboardInterrupt:
-        logger.info("Demo interrupted by user")
+    logger.info("Keyboard input simulation completed")
 
 
 if __name__ == "__main__":
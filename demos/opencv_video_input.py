@@ -107,9 +107,11 @@ def main() -> None:
     logger.info("Capturing frame...")
     frame = input_device.read()
 
-    # Convert NumPy array to PIL Image and save
+    # Wrap the frame buffer in a PIL Image without copying and save.
+    # read() returns C-contiguous RGB frames, so the buffer can be shared as is.
     logger.info(f"Saving frame to {output_path}")
-    im = Image.fromarray(frame)
+    height, width = frame.shape[:2]
+    im = Image.frombuffer("RGB", (width, height), frame, "raw", "RGB", 0, 1)
     im.save(output_path, format="PNG")
 
     logger.info("Frame captured and saved successfully!")
@@ -102,20 +102,19 @@ def main() -> None:
     logger.info(f"Sample rate: {args.sample_rate} Hz, Channels: {args.channels}")
     logger.info(f"Recording duration: {args.duration} seconds")
 
-    # Initialize the audio input
-    input_device = SoundcardAudioInput(
+    # Calculate number of frames to record based on duration
+    total_frames = int(args.sample_rate * args.duration)
+
+    # Initialize the audio input, closing the stream once recording is done
+    with SoundcardAudioInput(
         sample_rate=args.sample_rate,
         device_id=args.device,
         block_size=args.block_size,
         channels=args.channels,
-    )
-
-    # Calculate number of frames to record based on duration
-    total_frames = int(args.sample_rate * args.duration)
-
-    # Record audio
-    logger.info(f"Recording {args.duration} seconds of audio...")
-    audio_data = input_device.read(frame_size=total_frames)
+    ) as input_device:
+        # Record audio
+        logger.info(f"Recording {args.duration} seconds of audio...")
+        audio_data = input_device.read(frame_size=total_frames)
 
     # Save the recorded audio
     logger.info(f"Saving audio to {output_path}")
@@ -130,14 +130,6 @@ def main() -> None:
     logger.info(f"Sine wave: {args.frequency} Hz, Duration: {args.duration} seconds")
     logger.info(f"Amplitude: {args.amplitude}")
 
-    # Initialize the audio output
-    output_device = SoundcardAudioOutput(
-        sample_rate=args.sample_rate,
-        device_id=args.device,
-        block_size=args.block_size,
-        channels=args.channels,
-    )
-
     # Generate sine wave
     logger.info("Generating sine wave...")
     audio_data = generate_sine_wave(
@@ -150,9 +142,18 @@ def main() -> None:
     # Scale by amplitude
     audio_data *= args.amplitude
 
-    # Play the audio
-    logger.info(f"Playing {args.duration} seconds of {args.frequency} Hz sine wave...")
-    output_device.write(audio_data)
+    # Initialize the audio output, closing the stream once playback is done
+    with SoundcardAudioOutput(
+        sample_rate=args.sample_rate,
+        device_id=args.device,
+        block_size=args.block_size,
+        channels=args.channels,
+    ) as output_device:
+        # Play the audio
+        logger.info(
+            f"Playing {args.duration} seconds of {args.frequency} Hz sine wave..."
+        )
+        output_device.write(audio_data)
 
     logger.info("Playback completed!")
 
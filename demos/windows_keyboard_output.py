@@ -32,27 +32,30 @@ def main() -> None:
 
     logger.info("Starting keyboard input simulation demo")
 
-    # Countdown before starting
-    logger.info("Starting in 5 seconds. Please focus on your target application...")
-    for i in range(5, 0, -1):
-        print(f"{i}...")
-        time.sleep(1)
+    # Event.wait can not be interrupted by Ctrl+C on Windows, so time.sleep
+    # is used and the held key is released when KeyboardInterrupt is raised.
+    try:
+        # Countdown before starting
+        logger.info("Starting in 5 seconds. Please focus on your target application...")
+        for i in range(5, 0, -1):
+            print(f"{i}...")
+            time.sleep(1)
 
-    # Initialize the keyboard output
-    keyboard = WindowsKeyboardOutput()
+        # Initialize the keyboard output
+        keyboard = WindowsKeyboardOutput()
 
-    # Define the sequence of keys to press
-    keys = [Key.W, Key.A, Key.S, Key.D]
+        # Define the sequence of keys to press
+        keys = [Key.W, Key.A, Key.S, Key.D]
 
-    try:
         # Press each key in sequence with a 1-second delay
         for key in keys:
             logger.info(f"Pressing key: {key}")
             keyboard.press(key)
-            time.sleep(1.0)  # Wait 1 second.
-
-            logger.info(f"Releasing key: {key}")
-            keyboard.release(key)
+            try:
+                time.sleep(1.0)  # Wait 1 second.
+            finally:
+                logger.info(f"Releasing key: {key}")
+                keyboard.release(key)
 
         logger.info("Keyboard input simulation completed")
 
@@ -1,14 +1,17 @@
+from .buffer_pool import AudioBufferPool
 from .input import AudioInput
 from .output import AudioOutput
 from .utils import AudioFrame
 
-__all__ = ["AudioInput", "AudioOutput", "AudioFrame"]
+__all__ = ["AudioInput", "AudioOutput", "AudioFrame", "AudioBufferPool"]
 
+# soundcard raises OSError instead of ImportError at import if no audio
+# backend library is installed.
 try:
     from .input.soundcard import SoundcardAudioInput
     from .output.soundcard import SoundcardAudioOutput
 
     __all__.extend(["SoundcardAudioInput", "SoundcardAudioOutput"])
 
-except ModuleNotFoundError:
+except (ImportError, OSError):
     pass
@@ -0,0 +1,85 @@
+"""This module provides a pool of reusable audio buffers."""
+
+import threading
+
+import numpy as np
+
+from .utils import AudioFrame
+
+
+class AudioBufferPool:
+    """Thread-safe pool of reusable float32 audio buffers.
+
+    Buffers are kept per shape and handed out last in, first out, so the
+    most recently used (and most likely cached) buffer is reused first.
+    Small buffers are not pooled, as allocating them is cheaper than
+    managing them.
+
+    Buffers must be returned explicitly with `release` once they are no
+    longer used. A buffer must not be accessed after it was released.
+
+    Examples:
+        >>> pool = AudioBufferPool()
+        >>> buffer = pool.acquire((1024, 2))
+        >>> buffer.fill(0.0)  # e.g. audio_input.read_into(buffer)
+        >>> pool.release(buffer)
+        >>> pool.acquire((1024, 2)) is buffer
+        True
+    """
+
+    def __init__(self, capacity: int = 4, min_nbytes: int = 4096) -> None:
+        """Initializes an instance of AudioBufferPool.
+
+        Args:
+            capacity: Maximum number of idle buffers kept per shape.
+            min_nbytes: Buffers smaller than this size in bytes are not
+                pooled.
+
+        Raises:
+            ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError(f"Capacity must not be negative, got {capacity}")
+
+        self._capacity = capacity
+        self._min_nbytes = min_nbytes
+        self._free: dict[tuple[int, ...], list[AudioFrame]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: tuple[int, int]) -> AudioFrame:
+        """Gets a buffer with the given shape.
+
+        The contents of the returned buffer are undefined.
+
+        Args:
+            shape: Shape of the buffer, e.g. (frames, channels).
+
+        Returns:
+            A pooled buffer if one is idle, otherwise a newly allocated one.
+        """
+        with self._lock:
+            buffers = self._free.get(shape)
+            if buffers:
+                return buffers.pop()
+        return np.empty(shape, dtype=np.float32)
+
+    def release(self, buffer: AudioFrame) -> None:
+        """Returns a buffer to the pool for reuse.
+
+        Buffers that are too small, not C-contiguous float32 arrays, or do not
+        fit into the pool are left to the garbage collector.
+
+        Args:
+            buffer: The buffer to return.
+        """
+        if (
+            buffer.nbytes < self._min_nbytes
+            or buffer.dtype != np.float32
+            or not buffer.flags.c_contiguous
+        ):
+            return
+
+        with self._lock:
+            buffers = self._free.setdefault(buffer.shape, [])
+            if len(buffers) < self._capacity and not any(b is buffer for b in buffers):
+                buffers.append(buffer)
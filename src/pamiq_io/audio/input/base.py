@@ -1,6 +1,11 @@
 """This module provides audio input functionality for game-io."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+import numpy as np
 
 from ..utils import AudioFrame
 
@@ -26,6 +31,55 @@ class AudioInput(ABC):
             RuntimeError: If the audio frames cannot be read.
         """
 
+    def read_into(self, out: AudioFrame) -> AudioFrame:
+        """Reads audio frames from the input stream into a preallocated
+        array.
+
+        Reusing the same destination array avoids allocating a new array on
+        every read. The default implementation copies the result of `read`;
+        subclasses may override it to fill `out` directly.
+
+        Args:
+            out: Float32 destination array with shape (frame_size, channels).
+                Its number of rows determines how many frames are read.
+
+        Returns:
+            The destination array filled with the read frames.
+
+        Raises:
+            RuntimeError: If the audio frames cannot be read.
+        """
+        np.copyto(out, self.read(out.shape[0]))
+        return out
+
+    async def aread(self, frame_size: int) -> AudioFrame:
+        """Reads audio frames from the input stream without blocking the
+        event loop.
+
+        The blocking `read` runs on a single worker thread owned by this
+        instance, so concurrent calls are served in order. Subclasses with
+        native asynchronous support may override this method.
+
+        Args:
+            frame_size: Number of frames to read.
+
+        Returns:
+            Audio data as a numpy array with shape (frame_size, channels)
+            and values normalized between -1.0 and 1.0.
+
+        Raises:
+            RuntimeError: If the audio frames cannot be read.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, self.read, frame_size)
+
+    @cached_property
+    def _read_executor(self) -> ThreadPoolExecutor:
+        """Single worker thread used by `aread` to run blocking reads."""
+        return ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.__class__.__name__
+        )
+
     @property
     @abstractmethod
     def sample_rate(self) -> float:
@@ -1,10 +1,16 @@
 """This module provides audio input functionality for game-io."""
 
 import logging
-from typing import cast, override
+import threading
+import warnings
+from types import TracebackType
+from typing import Protocol, Self, cast, override
 
+import numpy as np
 import soundcard as sc
+from numpy.typing import NDArray
 
+from ..ring_buffer import AudioRingBuffer
 from ..utils import AudioFrame
 from .base import AudioInput
 
@@ -34,12 +40,149 @@ def show_all_input_devices() -> None:
         print(f'[{i}] ID: "{mic.id}" - {mic.name}')
 
 
+class _RecordingStream(Protocol):
+    """Protocol for the recording stream used by the background recorder."""
+
+    def record(self, numframes: int | None = None) -> NDArray[np.float32]: ...
+
+
+class _BackgroundRecorder:
+    """Records audio continuously into a ring buffer on a daemon thread.
+
+    The thread only references this object, not the owning audio input,
+    so the owner can still be garbage collected while recording runs.
+    """
+
+    def __init__(
+        self,
+        stream: _RecordingStream,
+        buffer_size: int,
+        channels: int,
+        block_size: int | None,
+        logger: logging.Logger,
+    ) -> None:
+        """Initializes the recorder and starts the recording thread.
+
+        Args:
+            stream: The opened recording stream.
+            buffer_size: Capacity of the ring buffer in frames.
+            channels: Number of audio channels.
+            block_size: Number of frames to record per iteration. If None,
+                whatever the backend has available is recorded.
+            logger: Logger used to report overflows and errors.
+        """
+        self._stream = stream
+        self._block_size = block_size
+        self._buffer = AudioRingBuffer(buffer_size, channels)
+        self._condition = threading.Condition()
+        self._logger = logger
+        self._error: Exception | None = None
+        self._running = True
+        self._thread = threading.Thread(target=self._record_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def capacity(self) -> int:
+        """Get the capacity of the ring buffer in frames."""
+        return self._buffer.capacity
+
+    def _record_loop(self) -> None:
+        """Background thread loop recording frames into the ring buffer."""
+        record = self._stream.record
+        block_size = self._block_size
+        channels = self._buffer.channels
+        # soundcard's record(None) concatenates each chunk from the backend
+        # with its pending frames, copying the chunk. Without a fixed block
+        # size, whole chunks are wanted anyway, so they are taken from the
+        # backend's recorder directly and reshaped as a view. This relies on
+        # soundcard's private `_record_chunk` (checked against soundcard
+        # 0.4.x), which may change in a soundcard upgrade. If it is missing,
+        # the public record method is used instead.
+        record_chunk = (
+            getattr(self._stream, "_record_chunk", None) if block_size is None else None
+        )
+        try:
+            while self._running:
+                if record_chunk is not None:
+                    chunk = record_chunk()
+                    # None is returned when a peek yields no bytes. Holes in
+                    # the stream are already filled with zeros by soundcard.
+                    if chunk is None:
+                        continue
+                    frames = chunk.reshape(-1, channels)
+                else:
+                    frames = record(numframes=block_size)
+                with self._condition:
+                    dropped = self._buffer.write(frames)
+                    self._condition.notify_all()
+                if dropped > 0:
+                    self._logger.debug(
+                        "Audio input buffer overflowed, dropped %d frames", dropped
+                    )
+        except Exception as e:
+            self._logger.error("Error recording audio frames: %s", e)
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def read_into(self, out: AudioFrame) -> AudioFrame:
+        """Waits until enough frames are recorded and reads them into out.
+
+        Args:
+            out: Destination array with shape (frames, channels).
+
+        Returns:
+            The destination array filled with the recorded frames.
+
+        Raises:
+            RuntimeError: If recording stopped before enough frames were
+                available.
+        """
+        frame_size = out.shape[0]
+        with self._condition:
+            self._condition.wait_for(
+                lambda: len(self._buffer) >= frame_size
+                or self._error is not None
+                or not self._running
+            )
+            if len(self._buffer) < frame_size:
+                raise RuntimeError("Background audio recording stopped.") from (
+                    self._error
+                )
+            return self._buffer.read_into(out)
+
+    def stop(self) -> bool:
+        """Stops the recording thread and wakes up waiting readers.
+
+        Returns:
+            True if the thread has stopped, False if it is still blocked in
+            the stream after the join timeout.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+        return not self._thread.is_alive()
+
+
 class SoundcardAudioInput(AudioInput):
     """Audio input implementation using the Soundcard library.
 
     This class captures audio using the Soundcard library which provides
     cross-platform audio input capabilities.
 
+    By default, `read` records from the device on the calling thread and
+    blocks until the requested frames are available. With `background=True`,
+    a daemon thread records continuously into a ring buffer so that `read`
+    only has to copy already recorded frames.
+
+    With `interleaved=False`, `read` returns planar audio with shape
+    (channels, frame_size) instead, so that the samples of each channel are
+    contiguous for per-channel processing such as filtering or FFT.
+
+    With `eager_start=False`, the audio stream is only opened on the first
+    read, which avoids holding many devices open when only some are used.
+
     Examples:
         >>> audio_input = SoundcardAudioInput(
         ...     sample_rate=44100,
@@ -48,6 +191,12 @@ class SoundcardAudioInput(AudioInput):
         ...     channels=1
         ... )
         >>> audio_frames = audio_input.read(frame_size=1024)
+        >>> audio_input.close()
+
+        The stream can also be closed automatically with a context manager:
+
+        >>> with SoundcardAudioInput(channels=1) as audio_input:
+        ...     audio_frames = audio_input.read(frame_size=1024)
     """
 
     def __init__(
@@ -56,6 +205,10 @@ class SoundcardAudioInput(AudioInput):
         device_id: str | None = None,
         block_size: int | None = None,
         channels: int = 1,
+        background: bool = False,
+        buffer_size: int | None = None,
+        interleaved: bool = True,
+        eager_start: bool = True,
     ) -> None:
         """Initializes an instance of SoundcardAudioInput.
 
@@ -65,6 +218,22 @@ class SoundcardAudioInput(AudioInput):
                 or None for default device.
             block_size: Size of each audio block for the recorder.
             channels: Number of audio channels to input (1 for mono, 2 for stereo).
+            background: If True, record continuously on a background thread
+                and serve `read` from a ring buffer.
+            buffer_size: Capacity in frames of the background ring buffer.
+                If None, one second of audio is buffered. Only used when
+                `background` is True.
+            interleaved: If True, `read` returns frames with shape
+                (frame_size, channels). If False, `read` returns planar
+                audio with shape (channels, frame_size).
+            eager_start: If True, the audio stream is opened (and background
+                recording is started) immediately. If False, this is deferred
+                until the first read, so that many inputs can be created
+                without holding their devices open.
+
+        Raises:
+            RuntimeError: If the audio stream cannot be opened when
+                `eager_start` is True.
         """
         # Get the microphone device
         if device_id is None:
@@ -74,18 +243,42 @@ class SoundcardAudioInput(AudioInput):
 
         self._sample_rate = sample_rate
         self._channels = channels
+        self._interleaved = interleaved
 
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-        # Open the recording stream
+        self._background = background
+        self._block_size = block_size
+        self._buffer_size = sample_rate if buffer_size is None else buffer_size
+
+        # The recorder object is created up front, but the device is only
+        # opened when the stream is entered.
         self._stream = self._mic.recorder(
             samplerate=sample_rate, channels=channels, blocksize=block_size
         )
-        self._stream.__enter__()
+        # The bound method is cached as it is looked up on every read.
+        self._record = self._stream.record
+        self._recorder: _BackgroundRecorder | None = None
+        self._started = False
+        self._closed = False
+        self._start_lock = threading.Lock()
+
+        if eager_start:
+            try:
+                self._ensure_stream()
+            except RuntimeError:
+                # Nothing is left to clean up for an input that failed to open.
+                self._closed = True
+                raise
 
         self.logger.debug(
-            f"Initialized audio input with sample_rate={sample_rate}, "
-            f"channels={channels}, block_size={block_size}"
+            "Initialized audio input with sample_rate=%d, channels=%d, "
+            "block_size=%s, background=%s, interleaved=%s",
+            sample_rate,
+            channels,
+            block_size,
+            background,
+            interleaved,
         )
 
     @property
@@ -117,19 +310,174 @@ class SoundcardAudioInput(AudioInput):
 
         Returns:
             Audio data as a numpy array with shape (frame_size, channels)
-            and values normalized between -1.0 and 1.0.
+            and values normalized between -1.0 and 1.0. If the input was
+            created with `interleaved=False`, the shape is
+            (channels, frame_size) and each channel is contiguous.
 
         Raises:
             RuntimeError: If the audio frames cannot be read.
+            ValueError: If frame_size exceeds the background buffer capacity.
         """
-        frames = self._stream.record(numframes=frame_size)
+        frames = self._read_interleaved(frame_size)
+        if self._interleaved:
+            return frames
+        return np.ascontiguousarray(frames.T)
+
+    @override
+    def read_into(self, out: AudioFrame) -> AudioFrame:
+        """Reads audio frames from the input stream into a preallocated
+        array.
+
+        Args:
+            out: Float32 destination array with shape (frame_size, channels),
+                or (channels, frame_size) if the input was created with
+                `interleaved=False`.
+
+        Returns:
+            The destination array filled with the read frames.
+
+        Raises:
+            RuntimeError: If the audio frames cannot be read.
+            ValueError: If the shape of out does not match the channel layout,
+                or the frame size exceeds the background buffer capacity.
+        """
+        frame_size = out.shape[0] if self._interleaved else out.shape[-1]
+        expected_shape = (
+            (frame_size, self._channels)
+            if self._interleaved
+            else (self._channels, frame_size)
+        )
+        if out.shape != expected_shape:
+            raise ValueError(
+                f"Output must have shape {expected_shape}, got {out.shape}"
+            )
+
+        if self._interleaved:
+            return self._read_interleaved(frame_size, out)
+        np.copyto(out, self._read_interleaved(frame_size).T)
+        return out
+
+    def _ensure_stream(self) -> None:
+        """Opens the audio stream and starts background recording if this has
+        not been done yet.
+
+        Raises:
+            RuntimeError: If the audio input is closed or the audio stream
+                cannot be opened.
+        """
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            if self._closed:
+                raise RuntimeError("Audio input is closed.")
+            try:
+                self._stream.__enter__()
+            except Exception as e:
+                raise RuntimeError(f"Failed to open audio input stream: {e}") from e
+            if self._background:
+                self._recorder = _BackgroundRecorder(
+                    self._stream,
+                    buffer_size=self._buffer_size,
+                    channels=self._channels,
+                    block_size=self._block_size,
+                    logger=self.logger,
+                )
+            self._started = True
+
+    def _read_interleaved(
+        self, frame_size: int, out: AudioFrame | None = None
+    ) -> AudioFrame:
+        """Reads audio frames with shape (frame_size, channels).
+
+        Args:
+            frame_size: Number of frames to read.
+            out: Optional destination array to read the frames into.
+
+        Returns:
+            Audio data as a numpy array with shape (frame_size, channels).
+            This is `out` if it was given.
+
+        Raises:
+            RuntimeError: If the audio input is closed.
+        """
+        # The closed stream must not be recorded from, as the backend may
+        # already have freed it.
+        if self._closed:
+            raise RuntimeError("Audio input is closed.")
+        self._ensure_stream()
+        if self._recorder is not None:
+            if frame_size > self._recorder.capacity:
+                raise ValueError(
+                    f"Frame size {frame_size} exceeds the background buffer "
+                    f"capacity of {self._recorder.capacity} frames"
+                )
+            if out is None:
+                out = np.empty((frame_size, self._channels), dtype=np.float32)
+            return self._recorder.read_into(out)
+
+        frames = self._record(numframes=frame_size)
         if frames.ndim != 2:
             raise ValueError("Retrieved data is not 2d array.")
-        return cast(AudioFrame, frames)
+        if out is None:
+            return cast(AudioFrame, frames)
+        np.copyto(out, frames)
+        return out
 
-    def __del__(self) -> None:
-        """Cleanup method to properly close the audio stream when the object is
-        destroyed."""
-        if hasattr(self, "_stream"):
+    def close(self) -> None:
+        """Closes the audio stream.
+
+        If the background recording thread is still blocked in the stream
+        after a timeout, the stream is left open.
+        Calling this method more than once has no effect.
+        """
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+        # The executor of aread is only created on first use.
+        if "_read_executor" in self.__dict__:
+            self._read_executor.shutdown(wait=False)
+        if self._recorder is not None and not self._recorder.stop():
+            # Exiting the stream while the thread is still recording from it
+            # tears down the backend under the thread, so it is left open.
+            self.logger.warning(
+                "Background recording thread did not stop, not closing the stream."
+            )
+            return
+        if self._started:
             self._stream.__exit__(None, None, None)
-            self.logger.debug("Audio stream closed")
+        self.logger.debug("Audio stream closed")
+
+    def __enter__(self) -> Self:
+        """Enters the context, returning this instance.
+
+        Returns:
+            This audio input instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exits the context, closing the audio stream."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Closes the audio stream as a last resort if it was not closed
+        explicitly.
+
+        Garbage collection may run long after the input is no longer used,
+        so a ResourceWarning is emitted to point at the missing `close` if the
+        stream was opened.
+        """
+        if hasattr(self, "_closed") and not self._closed:
+            if self._started:
+                warnings.warn(
+                    f"Unclosed audio input {self!r}", ResourceWarning, source=self
+                )
+            self.close()
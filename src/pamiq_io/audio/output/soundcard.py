@@ -2,13 +2,19 @@
 io."""
 
 import logging
-from typing import override
+from types import TracebackType
+from typing import Self, override
 
+import numpy as np
 import soundcard as sc
 
 from ..utils import AudioFrame
 from .base import AudioOutput
 
+# Number of frames of the reused mono expansion buffer when no block size is
+# given. Longer mono writes expand into a temporary array instead.
+DEFAULT_MONO_BUFFER_FRAMES = 4096
+
 
 def show_all_output_devices() -> None:
     """Display all available audio output devices.
@@ -49,6 +55,12 @@ class SoundcardAudioOutput(AudioOutput):
         ... )
         >>> audio_frames = np.zeros((1024, 2), dtype=np.float32)  # Silence
         >>> audio_output.write(audio_frames)
+        >>> audio_output.close()
+
+        The stream can also be closed automatically with a context manager:
+
+        >>> with SoundcardAudioOutput(channels=2) as audio_output:
+        ...     audio_output.write(audio_frames)
     """
 
     def __init__(
@@ -66,6 +78,9 @@ class SoundcardAudioOutput(AudioOutput):
                 or None for default device.
             block_size: Size of each audio block for the player.
             channels: Number of audio channels to output (1 for mono, 2 for stereo).
+
+        Raises:
+            RuntimeError: If the audio stream cannot be opened.
         """
         # Get the speaker device
         if device_id is None:
@@ -79,14 +94,28 @@ class SoundcardAudioOutput(AudioOutput):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
         # Open the playback stream
-        self._stream = self._speaker.player(
+        stream = self._speaker.player(
             samplerate=sample_rate, channels=channels, blocksize=block_size
         )
-        self._stream.__enter__()
+        try:
+            stream.__enter__()
+        except Exception as e:
+            raise RuntimeError(f"Failed to open audio output stream: {e}") from e
+        self._stream = stream
+        self._closed = False
+
+        # Reused when expanding 1D mono data of up to one block to all output
+        # channels. Its size is fixed, so that writing one long clip does not
+        # keep a large buffer alive for the life of the output.
+        self._mono_buffer: AudioFrame = np.empty(
+            (block_size or DEFAULT_MONO_BUFFER_FRAMES, channels), dtype=np.float32
+        )
 
         self.logger.debug(
-            f"Initialized audio output with sample_rate={sample_rate}, "
-            f"channels={channels}, block_size={block_size}"
+            "Initialized audio output with sample_rate=%d, channels=%d, block_size=%s",
+            sample_rate,
+            channels,
+            block_size,
         )
 
     @property
@@ -115,30 +144,88 @@ class SoundcardAudioOutput(AudioOutput):
 
         Args:
             data: Audio data as a numpy array with shape (frame_size, channels)
-                and values normalized between -1.0 and 1.0.
+                and values normalized between -1.0 and 1.0. 1D data is treated
+                as mono and played on all channels.
 
         Raises:
+            RuntimeError: If the audio output is closed.
             ValueError: If the data shape is incompatible with the configured channels.
         """
-        # Check shape compatibility
-        if data.ndim == 1:
-            # Single channel data, reshape to (frames, 1)
-            data = data.reshape(-1, 1)
+        # The closed stream must not be played to, as the backend may already
+        # have freed it.
+        if self._closed:
+            raise RuntimeError("Audio output is closed.")
 
-        if data.ndim != 2:
-            raise ValueError(f"Data must be 2D array, got shape {data.shape}")
-
-        if data.shape[1] != self.channels:
+        if data.ndim == 1:
+            if self._channels > 1:
+                data = self._expand_mono(data)
+            else:
+                # Single channel data, reshape to (frames, 1)
+                data = data.reshape(-1, 1)
+
+        # A single tuple comparison validates both dimensionality and channels
+        # on the common path; the detailed checks only run on failure.
+        if data.shape[1:] != (self._channels,):
+            if data.ndim != 2:
+                raise ValueError(f"Data must be 2D array, got shape {data.shape}")
             raise ValueError(
-                f"Data has {data.shape[1]} channels, but output configured for {self.channels} channels"
+                f"Data has {data.shape[1]} channels, but output configured for {self._channels} channels"
             )
 
-        # Play the data
+        # Play the data. The stream converts to C-contiguous float32 itself,
+        # so no extra cast is done here.
         self._stream.play(data)
 
+    def _expand_mono(self, data: np.ndarray) -> AudioFrame:
+        """Copies 1D mono data to all channels in a single vectorized pass.
+
+        Data that fits into the reused buffer is expanded into it. Longer data
+        is expanded into a temporary array.
+
+        Args:
+            data: Mono audio data with shape (frame_size,).
+
+        Returns:
+            The expanded audio data with shape (frame_size, channels).
+        """
+        frames = data.shape[0]
+        if frames <= self._mono_buffer.shape[0]:
+            out = self._mono_buffer[:frames]
+        else:
+            out = np.empty((frames, self._channels), dtype=np.float32)
+        np.copyto(out, data[:, np.newaxis])
+        return out
+
+    def close(self) -> None:
+        """Closes the audio stream.
+
+        Calling this method more than once has no effect.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.__exit__(None, None, None)
+        self.logger.debug("Audio stream closed")
+
+    def __enter__(self) -> Self:
+        """Enters the context, returning this instance.
+
+        Returns:
+            This audio output instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exits the context, closing the audio stream."""
+        self.close()
+
     def __del__(self) -> None:
-        """Cleanup method to properly close the audio stream when the object is
-        destroyed."""
-        if hasattr(self, "_stream"):
-            self._stream.__exit__(None, None, None)
-            self.logger.debug("Audio stream closed")
+        """Closes the audio stream as a last resort if it was not closed
+        explicitly."""
+        if hasattr(self, "_closed"):
+            self.close()
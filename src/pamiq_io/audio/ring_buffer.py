@@ -0,0 +1,168 @@
+"""This module provides a preallocated ring buffer for audio frames."""
+
+import numpy as np
+
+from .utils import AudioFrame
+
+
+class AudioRingBuffer:
+    """Fixed-capacity ring buffer for multichannel audio frames.
+
+    The storage is allocated once at construction with shape (capacity,
+    channels), so writing and reading frames never allocates. When more
+    frames are written than can be held, the oldest frames are overwritten.
+
+    This class is not thread-safe. Callers sharing an instance between
+    threads must synchronize access themselves.
+
+    Examples:
+        >>> buffer = AudioRingBuffer(capacity=4096, channels=2)
+        >>> buffer.write(np.zeros((1024, 2), dtype=np.float32))
+        0
+        >>> len(buffer)
+        1024
+        >>> buffer.read(512).shape
+        (512, 2)
+    """
+
+    def __init__(self, capacity: int, channels: int) -> None:
+        """Initializes an instance of AudioRingBuffer.
+
+        Args:
+            capacity: Maximum number of frames the buffer can hold.
+            channels: Number of audio channels per frame.
+
+        Raises:
+            ValueError: If capacity or channels is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        if channels <= 0:
+            raise ValueError(f"Channels must be positive, got {channels}")
+
+        self._buffer = np.empty((capacity, channels), dtype=np.float32)
+        self._capacity = capacity
+        self._channels = channels
+        self._head = 0  # Index of the next frame to write
+        self._size = 0  # Number of frames currently stored
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of frames the buffer can hold.
+
+        Returns:
+            The capacity in frames.
+        """
+        return self._capacity
+
+    @property
+    def channels(self) -> int:
+        """Get the number of audio channels per frame.
+
+        Returns:
+            The number of audio channels.
+        """
+        return self._channels
+
+    def __len__(self) -> int:
+        """Get the number of frames available for reading.
+
+        Returns:
+            The number of stored frames.
+        """
+        return self._size
+
+    def write(self, data: AudioFrame) -> int:
+        """Writes audio frames into the buffer.
+
+        Args:
+            data: Audio data as a numpy array with shape (frames, channels).
+
+        Returns:
+            The number of oldest frames that were overwritten because the
+            buffer was full.
+
+        Raises:
+            ValueError: If the data shape is incompatible with the buffer.
+        """
+        if data.ndim != 2 or data.shape[1] != self._channels:
+            raise ValueError(
+                f"Data must have shape (frames, {self._channels}), got {data.shape}"
+            )
+
+        frames = data.shape[0]
+        dropped = max(self._size + frames - self._capacity, 0)
+
+        # Only the newest frames that fit in the buffer are kept.
+        if frames > self._capacity:
+            data = data[-self._capacity :]
+            frames = self._capacity
+
+        end = self._head + frames
+        if end <= self._capacity:
+            self._buffer[self._head : end] = data
+        else:
+            first = self._capacity - self._head
+            self._buffer[self._head :] = data[:first]
+            self._buffer[: frames - first] = data[first:]
+
+        self._head = end % self._capacity
+        self._size = min(self._size + frames, self._capacity)
+        return dropped
+
+    def read_into(self, out: AudioFrame) -> AudioFrame:
+        """Reads the oldest frames into a preallocated array.
+
+        Args:
+            out: Destination array with shape (frames, channels). Its number
+                of rows determines how many frames are read.
+
+        Returns:
+            The destination array filled with the read frames.
+
+        Raises:
+            ValueError: If the destination shape is incompatible with the
+                buffer or not enough frames are available.
+        """
+        if out.ndim != 2 or out.shape[1] != self._channels:
+            raise ValueError(
+                f"Output must have shape (frames, {self._channels}), got {out.shape}"
+            )
+
+        frames = out.shape[0]
+        if frames > self._size:
+            raise ValueError(
+                f"Requested {frames} frames, but only {self._size} frames are available"
+            )
+
+        tail = (self._head - self._size) % self._capacity
+        end = tail + frames
+        if end <= self._capacity:
+            out[:] = self._buffer[tail:end]
+        else:
+            first = self._capacity - tail
+            out[:first] = self._buffer[tail:]
+            out[first:] = self._buffer[: frames - first]
+
+        self._size -= frames
+        return out
+
+    def read(self, frame_size: int) -> AudioFrame:
+        """Reads the oldest frames into a newly allocated array.
+
+        Args:
+            frame_size: Number of frames to read.
+
+        Returns:
+            Audio data as a numpy array with shape (frame_size, channels).
+
+        Raises:
+            ValueError: If not enough frames are available.
+        """
+        out: AudioFrame = np.empty((frame_size, self._channels), dtype=np.float32)
+        return self.read_into(out)
+
+    def clear(self) -> None:
+        """Discards all stored frames."""
+        self._head = 0
+        self._size = 0
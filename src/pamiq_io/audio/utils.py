@@ -1,3 +1,57 @@
 import numpy as np
 
 type AudioFrame = np.ndarray[tuple[int, int], np.dtype[np.float32]]
+type PCM16AudioFrame = np.ndarray[tuple[int, int], np.dtype[np.int16]]
+
+PCM16_SCALE = 32767.0
+
+
+def to_pcm16(
+    frames: AudioFrame,
+    out: PCM16AudioFrame | None = None,
+    scratch: AudioFrame | None = None,
+) -> PCM16AudioFrame:
+    """Converts float audio frames to 16-bit PCM.
+
+    Samples are scaled by 32767, rounded to the nearest integer and clipped,
+    so values outside [-1.0, 1.0] saturate instead of wrapping around. The
+    result takes half the memory of float32 frames, which suits pipelines
+    that only store or transmit audio.
+
+    The samples are scaled in a float32 intermediate array. To convert
+    blocks without allocating, pass both `out` and `scratch` and reuse them
+    across calls.
+
+    Args:
+        frames: Audio data with values normalized between -1.0 and 1.0.
+        out: Optional preallocated int16 array with the same shape as frames
+            to write the result into.
+        scratch: Optional preallocated float32 array with the same shape as
+            frames used as the intermediate. Its contents are overwritten.
+
+    Returns:
+        The 16-bit PCM audio data. This is `out` if it was given.
+
+    Raises:
+        ValueError: If out or scratch does not have the same shape as frames.
+    """
+    if out is None:
+        out = np.empty(frames.shape, dtype=np.int16)
+    elif out.shape != frames.shape:
+        raise ValueError(
+            f"Output shape {out.shape} does not match frames shape {frames.shape}"
+        )
+
+    if scratch is None:
+        scratch = np.empty(frames.shape, dtype=np.float32)
+    elif scratch.shape != frames.shape:
+        raise ValueError(
+            f"Scratch shape {scratch.shape} does not match frames shape "
+            f"{frames.shape}"
+        )
+
+    np.multiply(frames, PCM16_SCALE, out=scratch)
+    np.rint(scratch, out=scratch)
+    np.clip(scratch, -PCM16_SCALE, PCM16_SCALE, out=scratch)
+    np.copyto(out, scratch, casting="unsafe")
+    return out
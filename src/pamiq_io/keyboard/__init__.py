@@ -1,15 +1,15 @@
 import sys
 
-from .output import Key, KeyboardOutput
+from .output import Key, KeyAction, KeyboardOutput
 
-__all__ = ["Key", "KeyboardOutput"]
+__all__ = ["Key", "KeyAction", "KeyboardOutput"]
 
 if sys.platform == "linux":
     try:
         from .output.inputtino import InputtinoKeyboardOutput
 
         __all__.extend(["InputtinoKeyboardOutput"])
-    except ModuleNotFoundError:
+    except ImportError:
         pass
 
 if sys.platform == "win32":
@@ -17,5 +17,5 @@ if sys.platform == "win32":
         from .output.windows import WindowsKeyboardOutput
 
         __all__.extend(["WindowsKeyboardOutput"])
-    except ModuleNotFoundError:
+    except ImportError:
         pass
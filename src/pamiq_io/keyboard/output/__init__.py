@@ -1,3 +1,3 @@
-from .base import Key, KeyboardOutput
+from .base import Key, KeyAction, KeyboardOutput
 
-__all__ = ["Key", "KeyboardOutput"]
+__all__ = ["Key", "KeyAction", "KeyboardOutput"]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+import time
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from collections.abc import Iterable
+from enum import Enum, StrEnum, auto
 from functools import cache
 from typing import Self
 
@@ -33,6 +35,40 @@ class KeyboardOutput(ABC):
         """
         ...
 
+    def inject_sequence(self, events: Iterable[tuple[Key, KeyAction, float]]) -> None:
+        """Inject a timed sequence of key events.
+
+        Each event is scheduled relative to the scheduled time of the previous
+        event rather than to when it actually finished, so timing errors do
+        not accumulate over long sequences.
+
+        Args:
+            events: Sequence of (key, action, delay) tuples. The delay is the
+                number of seconds to wait after the previous event before
+                dispatching this one.
+
+        Examples:
+            >>> keyboard.inject_sequence([
+            ...     (Key.W, KeyAction.PRESS, 0.0),
+            ...     (Key.W, KeyAction.RELEASE, 1.0),
+            ... ])
+        """
+        dispatch = {KeyAction.PRESS: self.press, KeyAction.RELEASE: self.release}
+        deadline = time.perf_counter()
+        for key, action, delay in events:
+            deadline += delay
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            dispatch[action](key)
+
+
+class KeyAction(StrEnum):
+    """Enumerates key actions used in a key event sequence."""
+
+    PRESS = "press"
+    RELEASE = "release"
+
 
 class Key(Enum):
     """Enumeration of keyboard keys that can be pressed or released.
@@ -12,6 +12,19 @@ if sys.platform == "linux":
         Key.RIGHT_SUPER: _core.KeyCode.RIGHT_WIN,
     }
 
+    # Conversion table resolved once at import so that pressing a chord
+    # only costs a dict lookup per key.
+    def _resolve_key_code(key: Key) -> _core.KeyCode | None:
+        """Returns the inputtino key code of key, or None if it has none."""
+        try:
+            return _core.KeyCode[key.name]
+        except KeyError:
+            return KEY_CODE_FAIL_BACKS.get(key)
+
+    KEY_CODES: dict[Key, _core.KeyCode] = {
+        key: code for key in Key if (code := _resolve_key_code(key)) is not None
+    }
+
     class InputtinoKeyboardOutput(KeyboardOutput):
         """A high-level interface for simulating keyboard inputs.
 
@@ -31,11 +44,7 @@ if sys.platform == "linux":
         @staticmethod
         def to_inputtino_key_code(key: Key) -> _core.KeyCode:
             try:
-                return _core.KeyCode[key.name]
-            except KeyError:
-                pass
-            try:
-                return KEY_CODE_FAIL_BACKS[key]
+                return KEY_CODES[key]
             except KeyError:
                 raise KeyError(f"Key {key} can not be converted to Inputtino KeyCode.")
 
@@ -43,11 +52,15 @@ if sys.platform == "linux":
         def press(self, *keys: Key) -> None:
             """Press one or more keys simultaneously.
 
+            All keys are converted before any event is emitted, so an
+            unsupported key never leaves a chord partially pressed.
+
             Args:
                 *keys: Variable number of keys to press.
             """
-            for k in keys:
-                self._keyboard.press(self.to_inputtino_key_code(k))
+            press = self._keyboard.press
+            for code in [self.to_inputtino_key_code(k) for k in keys]:
+                press(code)
 
         @override
         def release(self, *keys: Key) -> None:
@@ -56,5 +69,6 @@ if sys.platform == "linux":
             Args:
                 *keys: Variable number of keys to release.
             """
-            for k in keys:
-                self._keyboard.release(self.to_inputtino_key_code(k))
+            release = self._keyboard.release
+            for code in [self.to_inputtino_key_code(k) for k in keys]:
+                release(code)
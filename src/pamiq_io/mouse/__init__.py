@@ -9,7 +9,7 @@ if sys.platform == "linux":
         from .output.inputtino import InputtinoMouseOutput
 
         __all__.extend(["InputtinoMouseOutput"])
-    except ModuleNotFoundError:
+    except ImportError:
         pass
 
 if sys.platform == "win32":
@@ -17,5 +17,5 @@ if sys.platform == "win32":
         from .output.windows import WindowsMouseOutput
 
         __all__.extend(["WindowsMouseOutput"])
-    except ModuleNotFoundError:
+    except ImportError:
         pass
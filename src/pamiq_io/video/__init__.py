@@ -1,14 +1,27 @@
 """Computer vision related utilities for pamiq-io."""
 
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
 from .input import VideoInput
 from .utils import VideoFrame
 
-__all__ = ["VideoInput", "VideoFrame"]
-
-try:
+if TYPE_CHECKING:
     from .input.opencv import OpenCVVideoInput
 
+__all__ = ["VideoInput", "VideoFrame"]
+
+# Importing OpenCV loads many native libraries and takes a noticeable time,
+# so the OpenCV input is only imported when it is first accessed.
+if find_spec("cv2") is not None:
     __all__.extend(["OpenCVVideoInput"])
 
-except ModuleNotFoundError:
-    pass
+
+def __getattr__(name: str) -> Any:
+    """Imports optional video inputs on first access."""
+    if name == "OpenCVVideoInput" and name in __all__:
+        from .input.opencv import OpenCVVideoInput
+
+        globals()[name] = OpenCVVideoInput
+        return OpenCVVideoInput
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,24 @@
 """This module provides OpenCV-based video input implementation."""
 
 import logging
-from typing import TypedDict, cast, override
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self, TypedDict, cast, override
 
 import cv2
 import numpy as np
 
 from .base import VideoFrame, VideoInput
 
+# Color conversion codes from OpenCV's channel order, keyed by channel count.
+_TO_RGB_CONVERSIONS = {
+    3: cv2.COLOR_BGR2RGB,
+    4: cv2.COLOR_BGRA2RGBA,
+}
+
 
 class DeviceInfo(TypedDict):
     index: int
@@ -92,6 +103,124 @@ def show_video_devices(max_devices: int = 10) -> None:
         print(f"[{device['index']}]{device_name}, Resolution: {width}x{height}")
 
 
+class _BackgroundGrabber:
+    """Captures frames continuously on a daemon thread into three slots.
+
+    The slots are triple buffered: the thread writes into the back slot and
+    swaps it with the ready slot, and readers swap the ready slot with the
+    front slot they return. The thread therefore never writes into the frame
+    last returned to the reader, which stays valid until the next read.
+
+    The thread only references the owning video input weakly between
+    captures, so the owner can still be garbage collected while capturing
+    runs, which ends the thread.
+    """
+
+    def __init__(
+        self,
+        capture: Callable[[np.ndarray | None], np.ndarray],
+        shape: tuple[int, int, int] | None,
+        logger: logging.Logger,
+    ) -> None:
+        """Initializes the grabber and starts the capture thread.
+
+        Args:
+            capture: Bound method capturing a frame into the given slot and
+                returning the captured frame. Only a weak reference to it is
+                kept.
+            shape: Shape of the frames used to preallocate the slots. If None,
+                the slots are allocated by the first captured frames.
+            logger: Logger used to report errors.
+        """
+        self._capture = weakref.WeakMethod(capture)
+        self._back, self._ready, self._front = (
+            [np.empty(shape, dtype=np.uint8) for _ in range(3)]
+            if shape is not None
+            else [None, None, None]
+        )
+        self._fresh = False
+        self._delivered = False
+        self._condition = threading.Condition()
+        self._logger = logger
+        self._error: Exception | None = None
+        self._running = True
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+
+    def _grab_loop(self) -> None:
+        """Background thread loop capturing frames into the back slot."""
+        capture_ref = self._capture
+        try:
+            while self._running:
+                capture = capture_ref()
+                if capture is None:  # The owner was garbage collected
+                    break
+                frame = capture(self._back)
+                # Drop the owner before waiting for the next frame.
+                del capture
+                with self._condition:
+                    self._back, self._ready = self._ready, frame
+                    self._fresh = True
+                    self._condition.notify_all()
+        except Exception as e:
+            self._logger.error("Error capturing video frames: %s", e)
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def read(self) -> np.ndarray:
+        """Returns the newest captured frame.
+
+        Waits only if no frame has been captured yet.
+
+        Returns:
+            The newest frame. It is overwritten by the capture thread after
+            the next read.
+
+        Raises:
+            ValueError: If capturing stopped because the captured frames did
+                not have the expected layout.
+            RuntimeError: If capturing has stopped for any other reason.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._fresh
+                or self._delivered
+                or self._error is not None
+                or not self._running
+            )
+            # Layout errors are raised as in the foreground read, so callers
+            # handle both modes alike.
+            if isinstance(self._error, ValueError):
+                raise ValueError(str(self._error)) from self._error
+            if self._error is not None or not self._running:
+                raise RuntimeError("Background video capture stopped.") from (
+                    self._error
+                )
+            if self._fresh:
+                self._front, self._ready = self._ready, self._front
+                self._fresh = False
+                self._delivered = True
+            return cast(np.ndarray, self._front)
+
+    def stop(self) -> bool:
+        """Stops the capture thread and wakes up waiting readers.
+
+        Returns:
+            True if the thread has stopped, False if it is still blocked in
+            the camera after the join timeout.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        # The thread may drop the last reference to the owner itself, which
+        # runs the owner's finalizer, and so this method, on the thread.
+        if self._thread is threading.current_thread():
+            return True
+        self._thread.join(timeout=1.0)
+        return not self._thread.is_alive()
+
+
 class OpenCVVideoInput(VideoInput):
     """Video input implementation using OpenCV.
 
@@ -102,6 +231,15 @@ class OpenCVVideoInput(VideoInput):
         expected_height: Expected height of captured frame.
         expected_fps: Expected FPS of capture.
         expected_channels: Expected number of channels in captured frame.
+        fourcc: Expected FOURCC code of the capture format.
+        buffer_size: Number of frames the driver is asked to buffer.
+        drop_stale: Whether stale buffered frames are skipped on read.
+        reuse_buffer: Whether read returns frames in a buffer reused across reads.
+
+    With `background=True`, a daemon thread keeps capturing frames so that
+    read returns the newest frame immediately instead of waiting for the
+    camera. Configure the camera before starting background capture, as it is
+    accessed from the capture thread.
 
     Examples:
         >>> cam = OpenCVVideoInput(
@@ -112,6 +250,12 @@ class OpenCVVideoInput(VideoInput):
         ... channels = 3,
         ... )
         >>> frame = cam.read()
+        >>> cam.close()
+
+        Background capture is stopped automatically with a context manager:
+
+        >>> with OpenCVVideoInput(camera=0, background=True) as cam:
+        ...     frame = cam.read()
     """
 
     def __init__(
@@ -122,6 +266,11 @@ class OpenCVVideoInput(VideoInput):
         fps: float | None = None,
         channels: int = 3,
         num_trials_on_read_failure: int = 10,
+        fourcc: str | None = None,
+        buffer_size: int | None = None,
+        drop_stale: bool = False,
+        reuse_buffer: bool = False,
+        background: bool = False,
     ) -> None:
         """Initializes an instance of OpenCVVideoInput.
 
@@ -132,7 +281,30 @@ class OpenCVVideoInput(VideoInput):
             fps: The desired frames per second (fps) of the video. If None, use the camera's default fps.
             channels: The desired number of color channels (default is 3 for RGB/BGR).
             num_trials_on_read_failure: Number of trials on read failure.
+            fourcc: The four character code of the capture format, selected before the
+                frame size and fps. MJPG lets most webcams deliver high resolutions at
+                full frame rate. If None, use the camera's default format.
+            buffer_size: The number of frames the driver should buffer. A small buffer
+                such as 1 keeps read frames fresh. If None, use the camera's default
+                buffer size.
+            drop_stale: If True, frames already queued in the driver are skipped so that
+                read returns the newest frame. Intended for live cameras; with video files
+                this skips frames.
+            reuse_buffer: If True, frames are converted into a buffer allocated once and
+                read returns that same buffer every time, so a returned frame is
+                overwritten by the next read. Copy frames that must outlive the next
+                read. If False, every read returns a newly allocated frame.
+            background: If True, frames are captured continuously on a background
+                thread and read returns the newest one without waiting for the camera.
+                Call close to stop the thread.
+
+        Raises:
+            RuntimeError: If the camera cannot be opened.
+            ValueError: If fourcc is not a four character code.
         """
+        if fourcc is not None and len(fourcc) != 4:
+            raise ValueError(f"FOURCC must be 4 characters, got {fourcc!r}.")
+
         if isinstance(camera, int):
             camera = cv2.VideoCapture(index=camera)
 
@@ -146,33 +318,98 @@ class OpenCVVideoInput(VideoInput):
         self.expected_height = height
         self.expected_fps = fps
         self.expected_channels = channels
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+        self.drop_stale = drop_stale
+        self.reuse_buffer = reuse_buffer
 
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.configure_camera()
 
+        # Frames are decoded into this buffer instead of a newly allocated
+        # array. Unless reuse_buffer is set, returned frames never alias it.
+        # If the frame size is unknown, the first decoded frame is kept instead.
+        self._frame_buf: np.ndarray | None = None
+        # Destination of the color conversion when reuse_buffer is set.
+        # Background capture converts into its own slots instead.
+        self._rgb_buf: np.ndarray | None = None
+        if self.width > 0 and self.height > 0:
+            shape = (self.height, self.width, self.expected_channels)
+            self._frame_buf = np.empty(shape, dtype=np.uint8)
+            if reuse_buffer and not background:
+                self._rgb_buf = np.empty(shape, dtype=np.uint8)
+
+        # Whether the frame layout was validated. Checked on the first read and
+        # again whenever the frame is reallocated or revalidate is called.
+        self._validated = False
+        # Validated frames always have the expected number of channels, so the
+        # color conversion is looked up once here instead of on every read.
+        self._to_rgb_code = _TO_RGB_CONVERSIONS.get(channels)
+
+        self._closed = False
+        self._grabber: _BackgroundGrabber | None = None
+        if background:
+            self._grabber = _BackgroundGrabber(
+                self._capture_into,
+                shape=(
+                    (self.height, self.width, self.expected_channels)
+                    if self.width > 0 and self.height > 0
+                    else None
+                ),
+                logger=self.logger,
+            )
+            # Stops the thread if the input is garbage collected unclosed.
+            weakref.finalize(self, self._grabber.stop)
+
     def configure_camera(self) -> None:
         """Configures the camera settings with the desired properties."""
-        if self.expected_width is not None:
-            if (
-                not self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.expected_width)
-                or self.width != self.expected_width
+        # The capture format must be selected first, as changing it may reset
+        # the frame size and fps on some backends such as V4L2.
+        if self.fourcc is not None:
+            if not self.camera.set(
+                cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*self.fourcc)
             ):
+                self.logger.warning(f"Failed to set fourcc to {self.fourcc}.")
+
+        width_set = self.expected_width is None or self.camera.set(
+            cv2.CAP_PROP_FRAME_WIDTH, self.expected_width
+        )
+        height_set = self.expected_height is None or self.camera.set(
+            cv2.CAP_PROP_FRAME_HEIGHT, self.expected_height
+        )
+        fps_set = self.expected_fps is None or self.camera.set(
+            cv2.CAP_PROP_FPS, self.expected_fps
+        )
+        if self.buffer_size is not None:
+            if not self.camera.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size):
+                self.logger.warning(f"Failed to set buffer size to {self.buffer_size}.")
+
+        # Query the applied values once instead of after every setting.
+        self.refresh_properties()
+
+        if self.expected_width is not None:
+            if not width_set or self.width != self.expected_width:
                 self.logger.warning(f"Failed to set width to {self.expected_width}.")
 
         if self.expected_height is not None:
-            if (
-                not self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.expected_height)
-                or self.height != self.expected_height
-            ):
+            if not height_set or self.height != self.expected_height:
                 self.logger.warning(f"Failed to set height to {self.expected_height}.")
 
         if self.expected_fps is not None:
-            if (
-                not self.camera.set(cv2.CAP_PROP_FPS, self.expected_fps)
-                or self.fps != self.expected_fps
-            ):
+            if not fps_set or self.fps != self.expected_fps:
                 self.logger.warning(f"Failed to set fps to {self.expected_fps}.")
 
+    def refresh_properties(self) -> None:
+        """Reloads the cached width, height and fps from the camera.
+
+        The properties are cached because querying the camera may issue a
+        driver call each time. Call this method if the camera is reconfigured
+        outside of this class.
+        """
+        self._width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self._height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._fps = float(self.camera.get(cv2.CAP_PROP_FPS))
+
     @property
     @override
     def channels(self) -> int:
@@ -191,7 +428,7 @@ class OpenCVVideoInput(VideoInput):
         Returns:
             The current width of the video frames.
         """
-        return int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
+        return self._width
 
     @property
     @override
@@ -201,7 +438,7 @@ class OpenCVVideoInput(VideoInput):
         Returns:
             The current height of the video frames.
         """
-        return int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return self._height
 
     @property
     @override
@@ -211,45 +448,199 @@ class OpenCVVideoInput(VideoInput):
         Returns:
             The current frames per second (fps) of the video.
         """
-        return float(self.camera.get(cv2.CAP_PROP_FPS))
+        return self._fps
+
+    def revalidate(self) -> None:
+        """Validates the layout of the next read frame again.
+
+        The frame dimensions and channel count are only validated on the
+        first read and whenever the captured frame size changes. Call this
+        method if the camera format is changed in a way that keeps the frame
+        size, e.g. switching the pixel format outside of this class.
+        """
+        self._validated = False
+
+    def _grab_latest(self) -> bool:
+        """Grabs the newest frame, skipping stale ones if drop_stale is set.
+
+        Grabbing only advances the driver queue without decoding. A grab that
+        returns within half a frame interval took a frame that was already
+        queued, so grabbing continues until a grab waits for a new frame or one
+        frame interval has elapsed.
+
+        Returns:
+            True if a frame was grabbed, False otherwise.
+        """
+        if not self.drop_stale:
+            return self.camera.grab()
+
+        fps = self.expected_fps or self.fps
+        if fps <= 0:
+            return self.camera.grab()
+
+        interval = 1.0 / fps
+        deadline = time.perf_counter() + interval
+        while True:
+            start = time.perf_counter()
+            if not self.camera.grab():
+                return False
+            now = time.perf_counter()
+            if now - start >= interval / 2 or now >= deadline:
+                return True
+
+    def _retrieve_frame(self) -> np.ndarray:
+        """Grabs, decodes and validates a frame from the camera.
+
+        Returns:
+            The decoded frame with shape (height, width, channels) in OpenCV's
+            channel order. The frame may refer to the decode buffer, which is
+            overwritten by the next retrieval.
+
+        Raises:
+            RuntimeError: If the frame cannot be read after num_trials_on_read_failure attempts.
+            ValueError: If the captured frame's number of channels doesn't match the expected channels.
+        """
+        grab_latest = self._grab_latest
+        retrieve = self.camera.retrieve
+        num_trials = self.num_trials_on_read_failure
+        for i in range(num_trials):
+            # Grab first and decode only once a frame has actually been
+            # acquired, so failed reads never pay the decoding cost.
+            if grab_latest():
+                ret, frame = retrieve(self._frame_buf)
+                if ret:
+                    # OpenCV allocates a new frame if the buffer does not fit
+                    # the captured frame, e.g. after a resolution change. Keep
+                    # that frame so that later reads decode into it again.
+                    if frame is not self._frame_buf:
+                        self._frame_buf = frame
+                        self._validated = False
+
+                    # If the frame is grayscale (2D), add a channel dimension
+                    # as a view without copying.
+                    if frame.ndim == 2:
+                        frame = frame[..., None]
+
+                    # The layout only changes together with the frame buffer,
+                    # so it is validated once instead of on every read.
+                    if not self._validated:
+                        if frame.ndim != 3:
+                            raise ValueError("Retrieved video frame must be 2d or 3d.")
+
+                        # Verify that the frame has the expected number of channels
+                        if frame.shape[-1] != self.expected_channels:
+                            raise ValueError(
+                                f"Captured frame has {frame.shape[-1]} channels, but expected {self.expected_channels} channels."
+                            )
+                        self._validated = True
+
+                    return frame
+
+            self.logger.warning(
+                "Failed to read input frame, retrying (%d/%d)...", i + 1, num_trials
+            )
+
+        raise RuntimeError("Failed to read input frame.")
+
+    def _capture_into(self, dst: np.ndarray | None) -> np.ndarray:
+        """Captures an RGB frame into dst for the background grabber.
+
+        Args:
+            dst: The slot to write the frame into, or None if no slot is
+                allocated yet.
+
+        Returns:
+            dst filled with the frame, or a newly allocated frame if dst is None
+            or does not fit the frame. The frame never refers to the decode
+            buffer.
+        """
+        frame = self._retrieve_frame()
+        code = self._to_rgb_code
+        if code is not None:
+            return cv2.cvtColor(frame, code, dst=dst)
+        if dst is None or dst.shape != frame.shape:
+            return frame.copy()
+        np.copyto(dst, frame)
+        return dst
 
     @override
     def read(self) -> VideoFrame:
         """Reads a frame from the video input.
 
+        With background capture, this returns the newest captured frame
+        without waiting for the camera. Only the first read waits until a
+        frame has been captured.
+
         Returns:
             The frame read from the video input with shape (height, width, channels).
+            The frame is a C-contiguous uint8 array, so its buffer can be handed to
+            other libraries (e.g. ``PIL.Image.frombuffer``) without copying.
 
         Raises:
-            RuntimeError: If the frame cannot be read after num_trials_on_read_failure attempts.
+            RuntimeError: If the frame cannot be read after num_trials_on_read_failure
+                attempts, or background capture has stopped.
             ValueError: If the captured frame's number of channels doesn't match the expected channels.
         """
-        for i in range(self.num_trials_on_read_failure):
-            ret, frame = self.camera.read()
-            if ret:
-                # If the frame is grayscale (2D), add a channel dimension
-                if frame.ndim == 2:
-                    frame = np.expand_dims(frame, -1)
-
-                if frame.ndim != 3:
-                    raise ValueError("Retrieved video frame must be 2d or 3d.")
-
-                # Verify that the frame has the expected number of channels
-                if frame.shape[-1] != self.expected_channels:
-                    raise ValueError(
-                        f"Captured frame has {frame.shape[-1]} channels, but expected {self.expected_channels} channels."
-                    )
-
-                # Convert BGR to RGB
-                if frame.shape[-1] == 3:
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                elif frame.shape[-1] == 4:
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGBA)
-
-                return cast(VideoFrame, np.asarray(frame, dtype=np.uint8, copy=False))
-            else:
-                self.logger.warning(
-                    f"Failed to read input frame, retrying ({i+1}/{self.num_trials_on_read_failure})..."
-                )
+        if self._grabber is not None:
+            frame = self._grabber.read()
+            return cast(VideoFrame, frame if self.reuse_buffer else frame.copy())
+
+        frame = self._retrieve_frame()
+
+        # Convert BGR to RGB in a single pass. The conversion writes into the
+        # reused buffer if set, or a new array otherwise.
+        code = self._to_rgb_code
+        if code is not None:
+            frame = cv2.cvtColor(frame, code, dst=self._rgb_buf)
+            if self.reuse_buffer:
+                self._rgb_buf = frame
+
+        # Frames without color conversion still refer to the decode buffer,
+        # which is overwritten by the next read.
+        if (
+            not self.reuse_buffer
+            and self._frame_buf is not None
+            and np.may_share_memory(frame, self._frame_buf)
+        ):
+            frame = frame.copy()
+
+        # Frames produced by OpenCV are already contiguous, in which case this
+        # returns the frame itself without copying.
+        return cast(VideoFrame, np.ascontiguousarray(frame))
+
+    def close(self) -> None:
+        """Stops background capture and releases the camera.
+
+        If the capture thread is still blocked in the camera after a timeout,
+        the camera is not released, as VideoCapture is not thread safe.
+        Calling this method more than once has no effect.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._grabber is not None and not self._grabber.stop():
+            # Releasing the camera while the thread is still inside grab is
+            # not thread safe, so the camera is left to the thread instead.
+            self.logger.warning(
+                "Background capture thread did not stop, not releasing the camera."
+            )
+            return
+        self.camera.release()
+        self.logger.debug("Video input closed")
 
-        raise RuntimeError("Failed to read input frame.")
+    def __enter__(self) -> Self:
+        """Enters the context, returning this instance.
+
+        Returns:
+            This video input instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exits the context, closing the video input."""
+        self.close()
@@ -1,8 +1,31 @@
+import asyncio
+import threading
+
+import numpy as np
 import pytest
 
 from pamiq_io.audio.input.base import AudioInput
 
 
+class AudioInputImpl(AudioInput):
+    """Minimal concrete AudioInput recording the threads reads run on."""
+
+    def __init__(self) -> None:
+        self.read_threads: list[str] = []
+
+    def read(self, frame_size: int):
+        self.read_threads.append(threading.current_thread().name)
+        return np.zeros((frame_size, 1), dtype=np.float32)
+
+    @property
+    def sample_rate(self) -> float:
+        return 16000
+
+    @property
+    def channels(self) -> int:
+        return 1
+
+
 class TestAudioInput:
     """Tests for the AudioInput abstract base class."""
 
@@ -10,3 +33,25 @@ class TestAudioInput:
     def test_abstract_methods(self, method_name):
         """Test that AudioInput correctly defines expected abstract methods."""
         assert method_name in AudioInput.__abstractmethods__
+
+    def test_read_into(self):
+        """Test that the default read_into fills the given array."""
+        audio_input = AudioInputImpl()
+        out = np.ones((4, 1), dtype=np.float32)
+
+        assert audio_input.read_into(out) is out
+        np.testing.assert_array_equal(out, np.zeros((4, 1)))
+
+    def test_aread(self):
+        """Test that aread runs read on a worker thread of the instance."""
+        audio_input = AudioInputImpl()
+
+        async def main():
+            return await asyncio.gather(audio_input.aread(4), audio_input.aread(4))
+
+        results = asyncio.run(main())
+
+        assert [r.shape for r in results] == [(4, 1), (4, 1)]
+        assert threading.main_thread().name not in audio_input.read_threads
+        # A single worker thread serves all reads of an instance
+        assert len(set(audio_input.read_threads)) == 1
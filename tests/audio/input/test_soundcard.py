@@ -1,7 +1,11 @@
 """Tests for the SoundcardAudioInput class."""
 
+import gc
 import shutil
 import sys
+import threading
+import time
+import warnings
 
 import numpy as np
 import pytest
@@ -15,6 +19,11 @@ if sys.platform == "linux":
             allow_module_level=True,
         )
 
+# Skip tests if the soundcard package itself is not installed. The backend
+# check above runs first, as importing soundcard without a backend fails with
+# errors other than ImportError.
+pytest.importorskip("soundcard")
+
 from pamiq_io.audio.input.soundcard import SoundcardAudioInput
 
 
@@ -26,6 +35,8 @@ class TestSoundcardAudioInput:
         """Creates a mock Microphone object."""
         mic = mocker.MagicMock()
         recorder = mocker.MagicMock()
+        # Backends without the private chunk API use record only
+        del recorder._record_chunk
         mic.recorder.return_value = recorder
         return mic
 
@@ -66,6 +77,81 @@ class TestSoundcardAudioInput:
             samplerate=48000, channels=2, blocksize=2048
         )
 
+    def test_init_stream_open_failure(self, mock_sc, mock_mic):
+        """Tests that failing to open the stream raises RuntimeError."""
+        mock_mic.recorder.return_value.__enter__.side_effect = OSError("busy")
+
+        with pytest.raises(RuntimeError, match="Failed to open audio input stream"):
+            SoundcardAudioInput()
+
+        # The unopened stream is never closed
+        mock_mic.recorder.return_value.__exit__.assert_not_called()
+
+    def test_lazy_start(self, mock_sc, mock_mic):
+        """Tests that the stream is only opened on the first read when not
+        started eagerly."""
+        recorder = mock_mic.recorder.return_value
+        recorder.record.return_value = np.zeros((256, 1), dtype=np.float32)
+
+        capture = SoundcardAudioInput(eager_start=False)
+        recorder.__enter__.assert_not_called()
+
+        capture.read(frame_size=256)
+        capture.read(frame_size=256)
+
+        recorder.__enter__.assert_called_once()
+
+    def test_lazy_start_stream_open_failure(self, mock_sc, mock_mic):
+        """Tests that failing to open a lazily started stream raises on
+        read."""
+        mock_mic.recorder.return_value.__enter__.side_effect = OSError("busy")
+        capture = SoundcardAudioInput(eager_start=False)
+
+        with pytest.raises(RuntimeError, match="Failed to open audio input stream"):
+            capture.read(frame_size=256)
+
+    def test_lazy_start_background(self, mock_sc, background_blocks):
+        """Tests that background recording starts with the lazily opened
+        stream."""
+        capture = SoundcardAudioInput(
+            channels=2, block_size=256, background=True, eager_start=False
+        )
+        assert capture._recorder is None
+
+        result = capture.read(frame_size=256)
+
+        np.testing.assert_array_equal(result, 0.25)
+        assert capture._recorder is not None
+        capture.close()
+
+    def test_close_without_start(self, mock_sc, mock_mic):
+        """Tests that closing a never started input does not exit the
+        stream."""
+        recorder = mock_mic.recorder.return_value
+        capture = SoundcardAudioInput(eager_start=False)
+
+        capture.close()
+
+        recorder.__exit__.assert_not_called()
+        with pytest.raises(RuntimeError, match="Audio input is closed"):
+            capture.read(frame_size=256)
+
+    def test_unopened_input_does_not_warn(self, mock_sc, mock_mic):
+        """Tests that inputs whose stream was never opened are collected
+        without a ResourceWarning."""
+        mock_mic.recorder.return_value.__enter__.side_effect = OSError("busy")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                SoundcardAudioInput()
+            except RuntimeError:
+                pass
+            SoundcardAudioInput(eager_start=False).__del__()
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
     def test_property_getters(self, mock_sc):
         """Tests the property getter methods."""
 
@@ -87,9 +173,8 @@ class TestSoundcardAudioInput:
         # Create test audio data
         test_frames = 1024
         test_channels = 2
-        test_audio = np.random.uniform(-1.0, 1.0, (test_frames, test_channels)).astype(
-            np.float32
-        )
+        rng = np.random.default_rng(0)
+        test_audio = rng.random((test_frames, test_channels), dtype=np.float32) * 2 - 1
 
         # Configure mock to return test data
         recorder = mock_mic.recorder.return_value
@@ -112,16 +197,249 @@ class TestSoundcardAudioInput:
         assert result.dtype == np.float32
         assert result.shape == (test_frames, test_channels)
 
-    def test_cleanup_on_deletion(self, mock_sc, mock_mic, mocker: MockerFixture):
-        """Tests that stream is properly closed on object deletion."""
+    def test_read_planar(self, mock_sc, mock_mic):
+        """Tests that non-interleaved reads return contiguous channel
+        planes."""
+        rng = np.random.default_rng(0)
+        test_audio = rng.random((1024, 2), dtype=np.float32) * 2 - 1
+        mock_mic.recorder.return_value.record.return_value = test_audio
+
+        capture = SoundcardAudioInput(channels=2, interleaved=False)
+        result = capture.read(frame_size=1024)
+
+        assert result.shape == (2, 1024)
+        assert result.dtype == np.float32
+        assert result.flags.c_contiguous
+        np.testing.assert_array_equal(result, test_audio.T)
+
+    def test_read_into_preallocated(self, mock_sc, mock_mic):
+        """Tests that read_into keeps filling the same caller-owned array."""
+        recorder = mock_mic.recorder.return_value
+        capture = SoundcardAudioInput(channels=2)
+        buf = np.empty((256, 2), dtype=np.float32)
+        buf_id = id(buf)
+
+        for i in range(1000):
+            recorder.record.return_value = np.full((256, 2), i, dtype=np.float32)
+            assert capture.read_into(buf) is buf
+
+        assert id(buf) == buf_id
+        np.testing.assert_array_equal(buf, np.full((256, 2), 999))
+
+    def test_read_into_planar(self, mock_sc, mock_mic):
+        """Tests that read_into uses the planar layout when not
+        interleaved."""
+        rng = np.random.default_rng(0)
+        test_audio = rng.random((256, 2), dtype=np.float32) * 2 - 1
+        mock_mic.recorder.return_value.record.return_value = test_audio
+        capture = SoundcardAudioInput(channels=2, interleaved=False)
+        out = np.empty((2, 256), dtype=np.float32)
+
+        assert capture.read_into(out) is out
+        mock_mic.recorder.return_value.record.assert_called_once_with(numframes=256)
+        np.testing.assert_array_equal(out, test_audio.T)
+
+    def test_read_into_shape_mismatch(self, mock_sc, mock_mic):
+        """Tests that a destination with the wrong channel count is
+        rejected."""
+        capture = SoundcardAudioInput(channels=2)
+
+        with pytest.raises(ValueError, match=r"Output must have shape \(256, 2\)"):
+            capture.read_into(np.empty((256, 1), dtype=np.float32))
+
+    def test_cleanup_on_deletion(self, mock_sc, mock_mic):
+        """Tests that deleting an unclosed input warns and closes the
+        stream."""
         recorder = mock_mic.recorder.return_value
+        capture = SoundcardAudioInput()
+
+        with pytest.warns(ResourceWarning, match="Unclosed audio input"):
+            capture.__del__()
+
+        recorder.__exit__.assert_called_once_with(None, None, None)
 
-        # Create and then delete the capture object
+    def test_double_close_is_idempotent(self, mock_sc, mock_mic):
+        """Tests that close exits the stream exactly once."""
+        recorder = mock_mic.recorder.return_value
         capture = SoundcardAudioInput()
 
-        # Use mocker to spy on __exit__ method
-        exit_spy = mocker.spy(recorder, "__exit__")
+        capture.close()
+        capture.close()
         capture.__del__()
 
-        # Verify that the stream was closed properly
-        exit_spy.assert_called_once_with(None, None, None)
+        recorder.__exit__.assert_called_once_with(None, None, None)
+
+    def test_close_shuts_down_read_executor(self, mock_sc, mock_mic):
+        """Tests that close shuts down the executor used by aread."""
+        capture = SoundcardAudioInput()
+        executor = capture._read_executor
+
+        capture.close()
+
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+    def test_close_does_not_create_read_executor(self, mock_sc, mock_mic):
+        """Tests that close does not create an executor that was never
+        used."""
+        capture = SoundcardAudioInput()
+
+        capture.close()
+
+        assert "_read_executor" not in capture.__dict__
+
+    @pytest.mark.parametrize("background", [False, True])
+    def test_read_after_close(self, mock_sc, mock_mic, background):
+        """Tests that reading from a closed input raises instead of recording
+        from the exited stream."""
+        recorder = mock_mic.recorder.return_value
+        with SoundcardAudioInput(channels=2, background=background) as capture:
+            pass
+        recorder.record.reset_mock()
+
+        with pytest.raises(RuntimeError, match="Audio input is closed"):
+            capture.read(frame_size=256)
+        with pytest.raises(RuntimeError, match="Audio input is closed"):
+            capture.read_into(np.empty((256, 2), dtype=np.float32))
+
+        recorder.record.assert_not_called()
+
+    def test_context_manager(self, mock_sc, mock_mic):
+        """Tests that leaving the context closes the stream."""
+        recorder = mock_mic.recorder.return_value
+
+        with SoundcardAudioInput() as capture:
+            assert isinstance(capture, SoundcardAudioInput)
+            recorder.__exit__.assert_not_called()
+
+        recorder.__exit__.assert_called_once_with(None, None, None)
+
+    @pytest.fixture
+    def background_blocks(self, mock_mic):
+        """Configures the recorder to return two sequential blocks and then
+        idle."""
+        blocks = [
+            np.full((256, 2), 0.25, dtype=np.float32),
+            np.full((256, 2), 0.5, dtype=np.float32),
+        ]
+
+        def record(numframes=None):
+            if blocks:
+                return blocks.pop(0)
+            time.sleep(0.001)
+            return np.zeros((0, 2), dtype=np.float32)
+
+        mock_mic.recorder.return_value.record.side_effect = record
+        return blocks
+
+    def test_read_background(self, mock_sc, mock_mic, background_blocks):
+        """Tests reading frames recorded by the background thread."""
+        capture = SoundcardAudioInput(
+            channels=2, block_size=256, background=True, buffer_size=1024
+        )
+
+        result = capture.read(frame_size=384)
+
+        assert result.shape == (384, 2)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result[:256], 0.25)
+        np.testing.assert_array_equal(result[256:], 0.5)
+        mock_mic.recorder.return_value.record.assert_any_call(numframes=256)
+
+        capture.close()
+
+    def test_read_into_background(self, mock_sc, background_blocks):
+        """Tests that read_into copies background frames into the given
+        array."""
+        capture = SoundcardAudioInput(
+            channels=2, block_size=256, background=True, buffer_size=1024
+        )
+        out = np.empty((384, 2), dtype=np.float32)
+
+        assert capture.read_into(out) is out
+        np.testing.assert_array_equal(out[:256], 0.25)
+        np.testing.assert_array_equal(out[256:], 0.5)
+
+        capture.close()
+
+    def test_read_background_backend_chunks(self, mock_sc, mock_mic, mocker):
+        """Tests that whole backend chunks are recorded without a fixed block
+        size."""
+        chunks = [np.full(512, 0.25, dtype=np.float32), None]
+
+        def record_chunk():
+            if chunks:
+                return chunks.pop(0)
+            time.sleep(0.001)
+            return np.zeros(0, dtype=np.float32)
+
+        recorder = mock_mic.recorder.return_value
+        recorder._record_chunk = mocker.Mock(side_effect=record_chunk)
+        capture = SoundcardAudioInput(channels=2, background=True)
+
+        result = capture.read(frame_size=256)
+
+        assert result.shape == (256, 2)
+        np.testing.assert_array_equal(result, 0.25)
+        recorder.record.assert_not_called()
+
+        capture.close()
+
+    def test_read_background_frame_size_exceeds_capacity(
+        self, mock_sc, background_blocks
+    ):
+        """Tests that frame sizes larger than the buffer are rejected."""
+        capture = SoundcardAudioInput(channels=2, background=True, buffer_size=128)
+
+        with pytest.raises(ValueError, match="exceeds the background buffer"):
+            capture.read(frame_size=256)
+
+        capture.close()
+
+    def test_read_background_recording_error(self, mock_sc, mock_mic):
+        """Tests that recording errors are surfaced to the reader."""
+        mock_mic.recorder.return_value.record.side_effect = OSError("device lost")
+        capture = SoundcardAudioInput(channels=2, background=True)
+
+        with pytest.raises(RuntimeError, match="Background audio recording stopped"):
+            capture.read(frame_size=256)
+
+        capture.close()
+
+    def test_close_stops_background_thread(self, mock_sc, background_blocks):
+        """Tests that closing the input stops the background thread."""
+        capture = SoundcardAudioInput(channels=2, background=True)
+        thread = capture._recorder._thread
+        assert thread.is_alive()
+
+        capture.close()
+
+        assert not thread.is_alive()
+
+    def test_close_keeps_stream_while_recording_is_blocked(
+        self, mocker, mock_sc, mock_mic
+    ):
+        """Tests that close does not exit the stream under a blocked
+        recording thread."""
+        recorder = mock_mic.recorder.return_value
+        recording = threading.Event()
+        unblock = threading.Event()
+
+        def record(numframes=None):
+            recording.set()
+            unblock.wait()
+            return np.zeros((256, 2), dtype=np.float32)
+
+        recorder.record.side_effect = record
+        capture = SoundcardAudioInput(channels=2, block_size=256, background=True)
+        assert recording.wait(timeout=1.0)
+        # Let the join time out immediately
+        mocker.patch.object(capture._recorder._thread, "join")
+
+        mock_warning = mocker.patch.object(capture.logger, "warning")
+
+        capture.close()
+
+        mock_warning.assert_called_once()
+        recorder.__exit__.assert_not_called()
+        unblock.set()
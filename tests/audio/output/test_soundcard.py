@@ -15,7 +15,15 @@ if sys.platform == "linux":
             allow_module_level=True,
         )
 
-from pamiq_io.audio.output.soundcard import SoundcardAudioOutput
+# Skip tests if the soundcard package itself is not installed. The backend
+# check above runs first, as importing soundcard without a backend fails with
+# errors other than ImportError.
+pytest.importorskip("soundcard")
+
+from pamiq_io.audio.output.soundcard import (
+    DEFAULT_MONO_BUFFER_FRAMES,
+    SoundcardAudioOutput,
+)
 
 
 class TestSoundcardAudioOutput:
@@ -64,6 +72,16 @@ class TestSoundcardAudioOutput:
             samplerate=48000, channels=2, blocksize=2048
         )
 
+    def test_init_stream_open_failure(self, mock_sc, mock_speaker):
+        """Tests that failing to open the stream raises RuntimeError."""
+        mock_speaker.player.return_value.__enter__.side_effect = OSError("busy")
+
+        with pytest.raises(RuntimeError, match="Failed to open audio output stream"):
+            SoundcardAudioOutput()
+
+        # The unopened stream is never closed
+        mock_speaker.player.return_value.__exit__.assert_not_called()
+
     def test_property_getters(self, mock_sc):
         """Tests the property getter methods."""
 
@@ -85,9 +103,8 @@ class TestSoundcardAudioOutput:
         # Create test audio data
         test_frames = 1024
         test_channels = 2
-        test_audio = np.random.uniform(-1.0, 1.0, (test_frames, test_channels)).astype(
-            np.float32
-        )
+        rng = np.random.default_rng(0)
+        test_audio = rng.random((test_frames, test_channels), dtype=np.float32) * 2 - 1
 
         # Initialize audio output
         output = SoundcardAudioOutput(
@@ -109,7 +126,8 @@ class TestSoundcardAudioOutput:
 
         # Create single channel test audio data
         test_frames = 1024
-        test_audio = np.random.uniform(-1.0, 1.0, test_frames).astype(np.float32)
+        rng = np.random.default_rng(0)
+        test_audio = rng.random(test_frames, dtype=np.float32) * 2 - 1
 
         # Initialize audio output for single channel
         output = SoundcardAudioOutput(
@@ -126,12 +144,51 @@ class TestSoundcardAudioOutput:
         # Check shape of data passed to play
         assert player.play.call_args[0][0].shape == (test_frames, 1)
 
+    def test_write_mono_to_stereo(self, mock_sc, mock_speaker):
+        """Tests that 1D mono data is played on all channels."""
+        test_audio = np.linspace(-1.0, 1.0, 512, dtype=np.float32)
+        output = SoundcardAudioOutput(sample_rate=44100, block_size=512, channels=2)
+        buffer = output._mono_buffer
+
+        output.write(test_audio)
+        output.write(test_audio)
+
+        player = mock_speaker.player.return_value
+        played = player.play.call_args[0][0]
+        assert played.shape == (512, 2)
+        np.testing.assert_array_equal(played[:, 0], test_audio)
+        np.testing.assert_array_equal(played[:, 1], test_audio)
+        # The expansion buffer is reused instead of reallocated
+        assert output._mono_buffer is buffer
+
+    @pytest.mark.parametrize(
+        "block_size,capacity", [(512, 512), (None, DEFAULT_MONO_BUFFER_FRAMES)]
+    )
+    def test_write_long_mono_keeps_buffer_size(
+        self, mock_sc, mock_speaker, block_size, capacity
+    ):
+        """Tests that mono data longer than the buffer is expanded without
+        growing the reused buffer."""
+        test_audio = np.linspace(-1.0, 1.0, capacity * 4, dtype=np.float32)
+        output = SoundcardAudioOutput(block_size=block_size, channels=2)
+        buffer = output._mono_buffer
+
+        output.write(test_audio)
+
+        played = mock_speaker.player.return_value.play.call_args[0][0]
+        assert played.shape == (capacity * 4, 2)
+        np.testing.assert_array_equal(played[:, 1], test_audio)
+        assert not np.shares_memory(played, buffer)
+        assert output._mono_buffer is buffer
+        assert buffer.shape == (capacity, 2)
+
     def test_write_channel_mismatch(self, mock_sc, mock_speaker):
         """Tests error handling for channel count mismatch."""
 
         # Create stereo audio data
         test_frames = 1024
-        test_audio = np.random.uniform(-1.0, 1.0, (test_frames, 2)).astype(np.float32)
+        rng = np.random.default_rng(0)
+        test_audio = rng.random((test_frames, 2), dtype=np.float32) * 2 - 1
 
         # Initialize audio output for mono
         output = SoundcardAudioOutput(
@@ -146,16 +203,53 @@ class TestSoundcardAudioOutput:
         ):
             output.write(test_audio)
 
-    def test_cleanup_on_deletion(self, mock_sc, mock_speaker, mocker: MockerFixture):
+    def test_write_invalid_ndim(self, mock_sc, mock_speaker):
+        """Tests error handling for data that is not 1D or 2D."""
+        output = SoundcardAudioOutput(sample_rate=44100, channels=2)
+
+        with pytest.raises(ValueError, match=r"Data must be 2D array"):
+            output.write(np.zeros((16, 2, 1), dtype=np.float32))
+
+    def test_cleanup_on_deletion(self, mock_sc, mock_speaker):
         """Tests that stream is properly closed on object deletion."""
         player = mock_speaker.player.return_value
 
         # Create and then delete the output object
         output = SoundcardAudioOutput()
-
-        # Use mocker to spy on __exit__ method
-        exit_spy = mocker.spy(player, "__exit__")
         output.__del__()
 
         # Verify that the stream was closed properly
-        exit_spy.assert_called_once_with(None, None, None)
+        player.__exit__.assert_called_once_with(None, None, None)
+
+    def test_close(self, mock_sc, mock_speaker):
+        """Tests that close exits the stream exactly once."""
+        player = mock_speaker.player.return_value
+        output = SoundcardAudioOutput()
+
+        output.close()
+        output.close()
+        output.__del__()
+
+        player.__exit__.assert_called_once_with(None, None, None)
+
+    def test_context_manager(self, mock_sc, mock_speaker):
+        """Tests that leaving the context closes the stream."""
+        player = mock_speaker.player.return_value
+
+        with SoundcardAudioOutput() as output:
+            assert isinstance(output, SoundcardAudioOutput)
+            player.__exit__.assert_not_called()
+
+        player.__exit__.assert_called_once_with(None, None, None)
+
+    def test_write_after_close(self, mock_sc, mock_speaker):
+        """Tests that writing to a closed output raises instead of playing to
+        the exited stream."""
+        player = mock_speaker.player.return_value
+        with SoundcardAudioOutput(channels=2) as output:
+            pass
+
+        with pytest.raises(RuntimeError, match="Audio output is closed"):
+            output.write(np.zeros((256, 2), dtype=np.float32))
+
+        player.play.assert_not_called()
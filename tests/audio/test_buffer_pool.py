@@ -0,0 +1,85 @@
+"""Tests for the AudioBufferPool class."""
+
+import numpy as np
+import pytest
+
+from pamiq_io.audio import AudioBufferPool
+
+
+class TestAudioBufferPool:
+    """Tests for the AudioBufferPool class."""
+
+    def test_acquire_allocates(self):
+        """Tests that an empty pool allocates float32 buffers."""
+        pool = AudioBufferPool()
+
+        buffer = pool.acquire((1024, 2))
+
+        assert buffer.shape == (1024, 2)
+        assert buffer.dtype == np.float32
+
+    def test_release_and_reuse_lifo(self):
+        """Tests that the most recently released buffer is reused first."""
+        pool = AudioBufferPool()
+        first = pool.acquire((1024, 2))
+        second = pool.acquire((1024, 2))
+
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.acquire((1024, 2)) is second
+        assert pool.acquire((1024, 2)) is first
+
+    def test_buffers_are_kept_per_shape(self):
+        """Tests that buffers are only reused for the same shape."""
+        pool = AudioBufferPool()
+        buffer = pool.acquire((1024, 2))
+        pool.release(buffer)
+
+        assert pool.acquire((2048, 1)) is not buffer
+        assert pool.acquire((1024, 2)) is buffer
+
+    def test_capacity(self):
+        """Tests that at most capacity idle buffers are kept per shape."""
+        pool = AudioBufferPool(capacity=1)
+        first = pool.acquire((1024, 2))
+        second = pool.acquire((1024, 2))
+
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.acquire((1024, 2)) is first
+        assert pool.acquire((1024, 2)) is not second
+
+    def test_double_release(self):
+        """Tests that releasing a buffer twice does not hand it out twice."""
+        pool = AudioBufferPool()
+        buffer = pool.acquire((1024, 2))
+
+        pool.release(buffer)
+        pool.release(buffer)
+
+        assert pool.acquire((1024, 2)) is buffer
+        assert pool.acquire((1024, 2)) is not buffer
+
+    @pytest.mark.parametrize(
+        "buffer",
+        [
+            np.empty((16, 2), dtype=np.float32),
+            np.empty((1024, 2), dtype=np.float64),
+            np.empty((2, 1024), dtype=np.float32).T,
+        ],
+    )
+    def test_release_ignores_unpoolable_buffers(self, buffer):
+        """Tests that small, non-float32 and non-contiguous buffers are not
+        pooled."""
+        pool = AudioBufferPool()
+
+        pool.release(buffer)
+
+        assert pool.acquire(buffer.shape) is not buffer
+
+    def test_invalid_capacity(self):
+        """Tests that a negative capacity is rejected."""
+        with pytest.raises(ValueError):
+            AudioBufferPool(capacity=-1)
@@ -0,0 +1,108 @@
+"""Tests for the AudioRingBuffer class."""
+
+import numpy as np
+import pytest
+
+from pamiq_io.audio.ring_buffer import AudioRingBuffer
+
+
+def make_frames(start: int, frames: int, channels: int = 2) -> np.ndarray:
+    """Creates sequential test frames so that order can be verified."""
+    values = np.arange(start, start + frames, dtype=np.float32)
+    return np.repeat(values[:, None], channels, axis=1)
+
+
+class TestAudioRingBuffer:
+    """Tests for the AudioRingBuffer class."""
+
+    def test_init(self):
+        """Tests initial properties."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+
+        assert buffer.capacity == 8
+        assert buffer.channels == 2
+        assert len(buffer) == 0
+
+    @pytest.mark.parametrize("capacity,channels", [(0, 2), (8, 0)])
+    def test_init_invalid(self, capacity, channels):
+        """Tests that non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            AudioRingBuffer(capacity=capacity, channels=channels)
+
+    def test_write_and_read(self):
+        """Tests that frames are read back in write order."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+
+        assert buffer.write(make_frames(0, 5)) == 0
+        assert len(buffer) == 5
+
+        result = buffer.read(3)
+
+        np.testing.assert_array_equal(result, make_frames(0, 3))
+        assert result.dtype == np.float32
+        assert len(buffer) == 2
+
+    def test_read_wraps_around(self):
+        """Tests reading and writing across the end of the storage."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+        buffer.write(make_frames(0, 6))
+        buffer.read(4)
+
+        buffer.write(make_frames(6, 5))
+
+        np.testing.assert_array_equal(buffer.read(7), make_frames(4, 7))
+        assert len(buffer) == 0
+
+    def test_write_overwrites_oldest(self):
+        """Tests that the oldest frames are dropped when full."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+        buffer.write(make_frames(0, 6))
+
+        assert buffer.write(make_frames(6, 4)) == 2
+        assert len(buffer) == 8
+        np.testing.assert_array_equal(buffer.read(8), make_frames(2, 8))
+
+    def test_write_larger_than_capacity(self):
+        """Tests that only the newest frames are kept for oversized writes."""
+        buffer = AudioRingBuffer(capacity=4, channels=2)
+
+        assert buffer.write(make_frames(0, 10)) == 6
+        np.testing.assert_array_equal(buffer.read(4), make_frames(6, 4))
+
+    def test_write_channel_mismatch(self):
+        """Tests that data with the wrong channel count is rejected."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+
+        with pytest.raises(ValueError, match=r"Data must have shape \(frames, 2\)"):
+            buffer.write(make_frames(0, 4, channels=1))
+
+    def test_read_into(self):
+        """Tests reading into a preallocated array."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+        buffer.write(make_frames(0, 4))
+        out = np.empty((4, 2), dtype=np.float32)
+
+        assert buffer.read_into(out) is out
+        np.testing.assert_array_equal(out, make_frames(0, 4))
+
+    def test_read_insufficient_frames(self):
+        """Tests that reading more frames than available raises an error."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+        buffer.write(make_frames(0, 2))
+
+        with pytest.raises(
+            ValueError, match="Requested 3 frames, but only 2 frames are available"
+        ):
+            buffer.read(3)
+
+        # Nothing is consumed on failure
+        assert len(buffer) == 2
+
+    def test_clear(self):
+        """Tests that clear discards all frames."""
+        buffer = AudioRingBuffer(capacity=8, channels=2)
+        buffer.write(make_frames(0, 4))
+
+        buffer.clear()
+
+        assert len(buffer) == 0
@@ -0,0 +1,66 @@
+"""Tests for audio utility functions."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from pamiq_io.audio.utils import to_pcm16
+
+
+class TestToPCM16:
+    """Tests for the to_pcm16 function."""
+
+    def test_conversion(self):
+        """Tests scaling, rounding and saturation of samples."""
+        frames = np.array(
+            [[0.0, 1.0], [-1.0, 0.5], [2.0, -2.0], [1e-5, -1e-5]], dtype=np.float32
+        )
+
+        result = to_pcm16(frames)
+
+        assert result.dtype == np.int16
+        np.testing.assert_array_equal(
+            result, [[0, 32767], [-32767, 16384], [32767, -32767], [0, 0]]
+        )
+
+    def test_preallocated_output(self):
+        """Tests that the result is written into the given array."""
+        frames = np.full((4, 2), 0.5, dtype=np.float32)
+        out = np.zeros((4, 2), dtype=np.int16)
+
+        assert to_pcm16(frames, out=out) is out
+        np.testing.assert_array_equal(out, np.full((4, 2), 16384))
+
+    def test_output_shape_mismatch(self):
+        """Tests that an output with a different shape is rejected."""
+        frames = np.zeros((4, 2), dtype=np.float32)
+
+        with pytest.raises(ValueError, match="does not match frames shape"):
+            to_pcm16(frames, out=np.zeros((4, 1), dtype=np.int16))
+
+    def test_preallocated_scratch_does_not_allocate(self):
+        """Tests that converting with out and scratch allocates no
+        arrays."""
+        frames = np.full((4096, 2), 0.5, dtype=np.float32)
+        out = np.empty((4096, 2), dtype=np.int16)
+        scratch = np.empty((4096, 2), dtype=np.float32)
+        to_pcm16(frames, out=out, scratch=scratch)
+
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            to_pcm16(frames, out=out, scratch=scratch)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak - baseline < out.nbytes
+        np.testing.assert_array_equal(out, np.full((4096, 2), 16384))
+
+    def test_scratch_shape_mismatch(self):
+        """Tests that a scratch array with a different shape is rejected."""
+        frames = np.zeros((4, 2), dtype=np.float32)
+
+        with pytest.raises(ValueError, match="Scratch shape"):
+            to_pcm16(frames, scratch=np.zeros((4, 1), dtype=np.float32))
@@ -0,0 +1,15 @@
+import tomllib
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def pyproject() -> dict[str, Any]:
+    """Parsed contents of the project's pyproject.toml, loaded once per
+    session."""
+    with open(PROJECT_ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)
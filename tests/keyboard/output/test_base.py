@@ -1,6 +1,19 @@
 import pytest
 
-from pamiq_io.keyboard.output.base import Key, KeyboardOutput
+from pamiq_io.keyboard.output.base import Key, KeyAction, KeyboardOutput
+
+
+class KeyboardOutputImpl(KeyboardOutput):
+    """Concrete implementation recording dispatched events for testing."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[KeyAction, tuple[Key, ...]]] = []
+
+    def press(self, *keys: Key) -> None:
+        self.events.append((KeyAction.PRESS, keys))
+
+    def release(self, *keys: Key) -> None:
+        self.events.append((KeyAction.RELEASE, keys))
 
 
 class TestKeyboardOutput:
@@ -8,6 +21,36 @@ class TestKeyboardOutput:
     def test_abstract_method(self, method):
         assert method in KeyboardOutput.__abstractmethods__
 
+    def test_inject_sequence(self, mocker):
+        """Test that events are dispatched in order with scheduled delays."""
+        now = [0.0]
+
+        def sleep(seconds: float) -> None:
+            now[0] += seconds
+
+        mocker.patch("time.perf_counter", side_effect=lambda: now[0])
+        mock_sleep = mocker.patch("time.sleep", side_effect=sleep)
+        keyboard = KeyboardOutputImpl()
+
+        keyboard.inject_sequence(
+            [
+                (Key.W, KeyAction.PRESS, 0.0),
+                (Key.W, KeyAction.RELEASE, 0.5),
+                (Key.A, KeyAction.PRESS, 0.0),
+                (Key.A, KeyAction.RELEASE, 0.25),
+            ]
+        )
+
+        assert keyboard.events == [
+            (KeyAction.PRESS, (Key.W,)),
+            (KeyAction.RELEASE, (Key.W,)),
+            (KeyAction.PRESS, (Key.A,)),
+            (KeyAction.RELEASE, (Key.A,)),
+        ]
+        # Zero delays dispatch immediately without sleeping
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.25]
+        assert now[0] == 0.75
+
 
 import pytest
 
@@ -8,7 +8,11 @@ skip_if_platform_is_not_linux()
 import inputtino as _core
 import pytest
 
-from pamiq_io.keyboard.output.inputtino import InputtinoKeyboardOutput, Key
+from pamiq_io.keyboard.output.inputtino import (
+    KEY_CODES,
+    InputtinoKeyboardOutput,
+    Key,
+)
 
 
 class TestInputtinoKeyboardOutput:
@@ -42,6 +46,17 @@ class TestInputtinoKeyboardOutput:
         mock_keyboard.press.assert_any_call(_core.KeyCode.CTRL)
         mock_keyboard.press.assert_any_call(_core.KeyCode.C)
 
+    def test_press_unsupported_key_presses_nothing(self, mock_keyboard, mocker):
+        """Test that a chord with an unconvertible key emits no events."""
+        mocker.patch.dict(KEY_CODES)
+        del KEY_CODES[Key.C]
+        kb_output = InputtinoKeyboardOutput()
+
+        with pytest.raises(KeyError):
+            kb_output.press(Key.CTRL, Key.C)
+
+        mock_keyboard.press.assert_not_called()
+
     def test_release(self, mock_keyboard):
         """Test releasing a key using KeyCode enum."""
         kb_output = InputtinoKeyboardOutput()
@@ -1,5 +1,11 @@
 """Tests for video_input module."""
 
+import gc
+import logging
+import threading
+import time
+import tracemalloc
+
 import cv2
 import numpy as np
 import pytest
@@ -10,15 +16,35 @@ from pamiq_io.video.input.opencv import OpenCVVideoInput
 class TestOpenCVVideoInput:
     """Tests for OpenCVVideoInput class."""
 
-    def test_init_with_camera_index(self, mocker):
+    @pytest.fixture
+    def mock_camera_factory(self, mocker):
+        """Returns a function creating mock cameras reporting the given frame
+        properties."""
+
+        def make(width: int = 640, height: int = 480, fps: float = 30):
+            props = {
+                cv2.CAP_PROP_FRAME_WIDTH: width,
+                cv2.CAP_PROP_FRAME_HEIGHT: height,
+                cv2.CAP_PROP_FPS: fps,
+            }
+            camera = mocker.MagicMock()
+            camera.set.return_value = True
+            camera.get.side_effect = props.__getitem__
+            return camera
+
+        return make
+
+    @pytest.fixture
+    def mock_warning(self, mocker):
+        """Patches the warning method of the OpenCVVideoInput logger."""
+        logger = logging.getLogger("pamiq_io.video.input.opencv.OpenCVVideoInput")
+        return mocker.patch.object(logger, "warning")
+
+    def test_init_with_camera_index(self, mocker, mock_camera_factory):
         """Test initialization with camera index."""
-        mock_camera = mocker.patch("cv2.VideoCapture")
-        mock_camera.return_value.set.return_value = True
-        mock_camera.return_value.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 640,
-            cv2.CAP_PROP_FRAME_HEIGHT: 480,
-            cv2.CAP_PROP_FPS: 30,
-        }[prop]
+        mock_camera = mocker.patch(
+            "cv2.VideoCapture", return_value=mock_camera_factory()
+        )
 
         capture = OpenCVVideoInput(camera=0)
 
@@ -28,6 +54,26 @@ class TestOpenCVVideoInput:
         assert capture.fps == 30
         assert capture.channels == 3  # Default value
 
+    def test_properties_are_cached(self, mocker):
+        """Test that properties are queried once and refreshed on demand."""
+        mock_camera = mocker.MagicMock()
+        props = {
+            cv2.CAP_PROP_FRAME_WIDTH: 640,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480,
+            cv2.CAP_PROP_FPS: 30,
+        }
+        mock_camera.get.side_effect = props.__getitem__
+
+        capture = OpenCVVideoInput(camera=mock_camera, width=640, height=480, fps=30)
+        assert mock_camera.get.call_count == 3
+
+        assert (capture.width, capture.height, capture.fps) == (640, 480, 30)
+        assert mock_camera.get.call_count == 3
+
+        props[cv2.CAP_PROP_FRAME_WIDTH] = 320
+        capture.refresh_properties()
+        assert capture.width == 320
+
     def test_cannot_open_camera(self, mocker):
         mock_camera = mocker.patch("cv2.VideoCapture")()
         mock_camera.isOpened.return_value = False
@@ -37,15 +83,9 @@ class TestOpenCVVideoInput:
         with pytest.raises(RuntimeError, match="Can not open camera."):
             OpenCVVideoInput(mock_camera)
 
-    def test_init_with_camera_object(self, mocker):
+    def test_init_with_camera_object(self, mock_camera_factory):
         """Test initialization with camera object."""
-        mock_camera = mocker.MagicMock()
-        mock_camera.set.return_value = True
-        mock_camera.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 1280,
-            cv2.CAP_PROP_FRAME_HEIGHT: 720,
-            cv2.CAP_PROP_FPS: 60,
-        }[prop]
+        mock_camera = mock_camera_factory(width=1280, height=720, fps=60)
 
         capture = OpenCVVideoInput(
             camera=mock_camera, width=1280, height=720, fps=60, channels=4
@@ -56,115 +96,168 @@ class TestOpenCVVideoInput:
         assert capture.fps == 60
         assert capture.channels == 4  # Custom channels value
 
-    def test_configure_camera_warning_on_failure(self, mocker, caplog):
-        """Test warning when camera config fails."""
+    def test_configure_camera_sets_fourcc_first(self, mocker):
+        """Test that the capture format is selected before the frame size."""
         mock_camera = mocker.MagicMock()
+        mock_camera.set.return_value = True
+
+        OpenCVVideoInput(camera=mock_camera, width=1280, height=720, fourcc="YUYV")
+
+        set_props = [call[0][0] for call in mock_camera.set.call_args_list]
+        assert set_props[0] == cv2.CAP_PROP_FOURCC
+        assert mock_camera.set.call_args_list[0][0][1] == cv2.VideoWriter.fourcc(
+            *"YUYV"
+        )
+        assert set_props.index(cv2.CAP_PROP_FRAME_WIDTH) > 0
+
+    def test_invalid_fourcc(self, mocker):
+        """Test that malformed FOURCC codes are rejected."""
+        with pytest.raises(ValueError, match="FOURCC must be 4 characters"):
+            OpenCVVideoInput(camera=mocker.MagicMock(), fourcc="MJPEG")
+
+    def test_configure_camera_warning_on_failure(
+        self, mocker, mock_camera_factory, mock_warning
+    ):
+        """Test warning when camera config fails."""
+        # Return different values for get to simulate mismatch
+        mock_camera = mock_camera_factory(width=320, height=240, fps=15)
         # Return False for set to simulate failure
         mock_camera.set.return_value = False
-        # Return different values for get to simulate mismatch
-        mock_camera.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 320,  # Different from expected 640
-            cv2.CAP_PROP_FRAME_HEIGHT: 240,  # Different from expected 480
-            cv2.CAP_PROP_FPS: 15,  # Different from expected 30
-        }[prop]
 
-        OpenCVVideoInput(camera=mock_camera, width=1, height=1, fps=1)
+        OpenCVVideoInput(
+            camera=mock_camera, width=1, height=1, fps=1, fourcc="MJPG", buffer_size=1
+        )
 
         # Check if warnings were logged
-        assert "Failed to set width" in caplog.text
-        assert "Failed to set height" in caplog.text
-        assert "Failed to set fps" in caplog.text
+        mock_warning.assert_has_calls(
+            [
+                mocker.call("Failed to set fourcc to MJPG."),
+                mocker.call("Failed to set buffer size to 1."),
+                mocker.call("Failed to set width to 1."),
+                mocker.call("Failed to set height to 1."),
+                mocker.call("Failed to set fps to 1."),
+            ]
+        )
 
-    def test_read_success_with_bgr_to_rgb_conversion(self, mocker):
-        """Test successful frame read with BGR to RGB conversion."""
+    @pytest.mark.parametrize(
+        "channels,frame,expected",
+        [
+            # Grayscale (2D) frames gain a channel dimension
+            (1, [[0, 128]], [[[0], [128]]]),
+            # Blue, green and red pixels in BGR are converted to RGB
+            (
+                3,
+                [[[255, 0, 0], [0, 255, 0], [0, 0, 255]]],
+                [[[0, 0, 255], [0, 255, 0], [255, 0, 0]]],
+            ),
+            # Opaque blue and translucent red in BGRA keep their alpha in RGBA
+            (
+                4,
+                [[[255, 0, 0, 255], [0, 0, 255, 128]]],
+                [[[0, 0, 255, 255], [255, 0, 0, 128]]],
+            ),
+        ],
+        ids=["grayscale", "bgr_to_rgb", "bgra_to_rgba"],
+    )
+    def test_read(self, mocker, channels, frame, expected):
+        """Test successful frame read with conversion to RGB channel
+        order."""
         mock_camera = mocker.MagicMock()
+        mock_camera.retrieve.return_value = (True, np.array(frame, dtype=np.uint8))
 
-        # Create a simple BGR test pattern (Blue, Green, Red)
-        # Blue pixel (255, 0, 0) in BGR should become (0, 0, 255) in RGB
-        bgr_frame = np.zeros((1, 3, 3), dtype=np.uint8)
-        # First pixel: Blue in BGR (255, 0, 0)
-        bgr_frame[0, 0] = [255, 0, 0]
-        # Second pixel: Green in BGR (0, 255, 0)
-        bgr_frame[0, 1] = [0, 255, 0]
-        # Third pixel: Red in BGR (0, 0, 255)
-        bgr_frame[0, 2] = [0, 0, 255]
-
-        # Set up the mock to return our test frame
-        mock_camera.read.return_value = (True, bgr_frame)
-
-        # Create capture object with mock camera
-        capture = OpenCVVideoInput(camera=mock_camera)
-
-        # Get the frame with color conversion applied
+        capture = OpenCVVideoInput(camera=mock_camera, channels=channels)
         result = capture.read()
 
-        # Verify color conversion: BGR to RGB
-        # Blue in BGR (255, 0, 0) should be Red in RGB (255, 0, 0)
-        assert result[0, 0, 0] == 0  # R channel (was B)
-        assert result[0, 0, 1] == 0  # G channel
-        assert result[0, 0, 2] == 255  # B channel (was R)
-
-        # Green stays the same in BGR and RGB
-        assert result[0, 1, 0] == 0  # R channel
-        assert result[0, 1, 1] == 255  # G channel
-        assert result[0, 1, 2] == 0  # B channel
-
-        # Red in BGR (0, 0, 255) should be Blue in RGB (0, 0, 255)
-        assert result[0, 2, 0] == 255  # R channel (was B)
-        assert result[0, 2, 1] == 0  # G channel
-        assert result[0, 2, 2] == 0  # B channel (was R)
-
-    def test_read_with_bgra_to_rgba_conversion(self, mocker):
-        """Test frame read with BGRA to RGBA conversion for 4-channel
-        images."""
+        assert result.dtype == np.uint8
+        assert result.flags.c_contiguous
+        np.testing.assert_array_equal(result, np.array(expected, dtype=np.uint8))
+
+    def test_read_returns_contiguous_frame(self, mocker):
+        """Test that frames are C-contiguous even if the backend returns a
+        strided view."""
         mock_camera = mocker.MagicMock()
+        mock_frame = np.arange(480 * 1280, dtype=np.uint8).reshape(480, 1280)[:, ::2]
+        assert not mock_frame.flags.c_contiguous
 
-        # Create a BGRA test pattern with alpha
-        bgra_frame = np.zeros((1, 2, 4), dtype=np.uint8)
-        # First pixel: Blue with full opacity in BGRA (255, 0, 0, 255)
-        bgra_frame[0, 0] = [255, 0, 0, 255]
-        # Second pixel: Transparent red in BGRA (0, 0, 255, 128)
-        bgra_frame[0, 1] = [0, 0, 255, 128]
+        mock_camera.retrieve.return_value = (True, mock_frame)
 
-        mock_camera.read.return_value = (True, bgra_frame)
+        capture = OpenCVVideoInput(camera=mock_camera, channels=1)
+        result = capture.read()
 
-        # Create capture object with 4 channels
-        capture = OpenCVVideoInput(camera=mock_camera, channels=4)
+        assert result.flags.c_contiguous
+        np.testing.assert_array_equal(result[..., 0], mock_frame)
 
-        # Get the frame with color conversion applied
-        result = capture.read()
+    def test_read_retrieves_into_preallocated_buffer(self, mock_camera_factory):
+        """Test that frames are decoded into a buffer allocated once."""
+        mock_camera = mock_camera_factory()
 
-        # Verify BGRA to RGBA conversion
-        # Blue in BGRA should become Red in RGBA with preserved alpha
-        assert result[0, 0, 0] == 0  # R channel (was B)
-        assert result[0, 0, 1] == 0  # G channel
-        assert result[0, 0, 2] == 255  # B channel (was R)
-        assert result[0, 0, 3] == 255  # Alpha unchanged
-
-        # Red in BGRA should become Blue in RGBA with preserved alpha
-        assert result[0, 1, 0] == 255  # R channel (was B)
-        assert result[0, 1, 1] == 0  # G channel
-        assert result[0, 1, 2] == 0  # B channel (was R)
-        assert result[0, 1, 3] == 128  # Alpha unchanged
-
-    def test_read_grayscale_success(self, mocker):
-        """Test successful frame read for grayscale images."""
-        mock_camera = mocker.MagicMock()
-        # Create a grayscale frame (2D)
-        mock_frame = np.zeros((480, 640), dtype=np.uint8)
-        # Add some values for testing
-        mock_frame[240, 320] = 128
+        def retrieve(image=None):
+            image[:] = 7
+            return True, image
 
-        mock_camera.read.return_value = (True, mock_frame)
+        mock_camera.retrieve.side_effect = retrieve
 
-        # Set to expect 1 channel
         capture = OpenCVVideoInput(camera=mock_camera, channels=1)
+        first = capture.read()
+        second = capture.read()
+
+        buffers = [c.args[0] for c in mock_camera.retrieve.call_args_list]
+        assert buffers[0].shape == (480, 640, 1)
+        assert buffers[0] is buffers[1]
+
+        # Returned frames must not alias the reused decode buffer
+        assert not np.shares_memory(first, buffers[0])
+        assert not np.shares_memory(first, second)
+        assert np.all(first == 7)
+
+    @pytest.mark.parametrize("reuse_buffer", [False, True])
+    def test_read_reuse_buffer(self, mock_camera_factory, reuse_buffer):
+        """Test that reuse_buffer converts into one buffer across reads."""
+        mock_camera = mock_camera_factory(width=2, height=1)
+        bgr_frame = np.array([[[255, 0, 0], [0, 0, 255]]], dtype=np.uint8)
+        mock_camera.retrieve.return_value = (True, bgr_frame)
+
+        capture = OpenCVVideoInput(camera=mock_camera, reuse_buffer=reuse_buffer)
+        first = capture.read()
+        np.testing.assert_array_equal(first, bgr_frame[..., ::-1])
+        second = capture.read()
+
+        assert (first is second) == reuse_buffer
+        assert second.flags.c_contiguous
+        np.testing.assert_array_equal(second, bgr_frame[..., ::-1])
+
+    def test_read_uses_preallocated_buffer(self, mock_camera_factory):
+        """Test that reuse_buffer returns the same buffer for consecutive
+        reads."""
+        mock_camera = mock_camera_factory()
+
+        def retrieve(image=None):
+            image[:] = 1
+            return True, image
+
+        mock_camera.retrieve.side_effect = retrieve
+
+        capture = OpenCVVideoInput(camera=mock_camera, reuse_buffer=True)
+        first = capture.read()
+        second = capture.read()
+
+        assert np.shares_memory(first, capture._rgb_buf)
+        assert np.shares_memory(second, capture._rgb_buf)
+
+    def test_read_adopts_reallocated_frame(self, mock_camera_factory):
+        """Test that a frame reallocated by OpenCV becomes the decode
+        buffer."""
+        mock_camera = mock_camera_factory()
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        mock_camera.retrieve.return_value = (True, frame)
+
+        capture = OpenCVVideoInput(camera=mock_camera)
         result = capture.read()
+        capture.read()
 
-        # Check that shape is (height, width, 1) after processing
-        assert result.shape == (480, 640, 1)
-        # Verify values are preserved
-        assert result[240, 320, 0] == 128
+        assert result.shape == (720, 1280, 3)
+        assert capture._frame_buf is frame
+        assert mock_camera.retrieve.call_args.args[0] is frame
 
     def test_read_channel_mismatch_error(self, mocker):
         """Test channel mismatch error during frame read."""
@@ -172,7 +265,7 @@ class TestOpenCVVideoInput:
         # Create a frame with 3 channels
         mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
 
-        mock_camera.read.return_value = (True, mock_frame)
+        mock_camera.retrieve.return_value = (True, mock_frame)
 
         # Set to expect 1 channel, which doesn't match the frame
         capture = OpenCVVideoInput(camera=mock_camera, channels=1)
@@ -182,31 +275,81 @@ class TestOpenCVVideoInput:
         ):
             capture.read()
 
-    def test_read_failure(self, mocker, caplog):
+    def test_channel_mismatch_still_raises_on_first_call(self, mocker):
+        """Test that a reallocated frame is validated again after a
+        successful read."""
+        mock_camera = mocker.MagicMock()
+        mock_camera.retrieve.side_effect = [
+            (True, np.zeros((480, 640, 3), dtype=np.uint8)),
+            (True, np.zeros((480, 640, 4), dtype=np.uint8)),
+        ]
+
+        capture = OpenCVVideoInput(camera=mock_camera)
+        capture.read()
+
+        with pytest.raises(ValueError, match="Captured frame has 4 channels"):
+            capture.read()
+
+    def test_subsequent_reads_skip_validation(self, mock_camera_factory):
+        """Test that frames decoded into the same buffer are validated only
+        once until revalidate is called."""
+        mock_camera = mock_camera_factory()
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+
+        capture = OpenCVVideoInput(camera=mock_camera)
+        capture.read()
+        assert capture._validated
+
+        # A layout change that keeps the buffer goes unnoticed until revalidation
+        capture.expected_channels = 4
+        capture.read()
+
+        capture.revalidate()
+        with pytest.raises(ValueError, match="Captured frame has 3 channels"):
+            capture.read()
+
+    def test_read_failure(self, mocker, mock_warning):
         """Test read failure after multiple attempts."""
         mock_camera = mocker.MagicMock()
-        mock_camera.read.return_value = (False, None)  # Always fail
+        mock_camera.grab.return_value = False  # Always fail
 
         capture = OpenCVVideoInput(camera=mock_camera, num_trials_on_read_failure=3)
 
         with pytest.raises(RuntimeError, match="Failed to read input frame"):
             capture.read()
 
-        assert mock_camera.read.call_count == 3
-        # Check that debug messages were logged for each retry
-        assert "Failed to read input frame, retrying (1/3)" in caplog.text
-        assert "Failed to read input frame, retrying (2/3)" in caplog.text
-        assert "Failed to read input frame, retrying (3/3)" in caplog.text
+        assert mock_camera.grab.call_count == 3
+        # Frames are never decoded when grabbing fails
+        mock_camera.retrieve.assert_not_called()
 
-    def test_init_with_none_parameters(self, mocker):
+        # Check that warnings were logged for each retry
+        mock_warning.assert_has_calls(
+            [
+                mocker.call("Failed to read input frame, retrying (%d/%d)...", i, 3)
+                for i in range(1, 4)
+            ]
+        )
+
+    def test_read_retries_on_retrieve_failure(self, mocker):
+        """Test that a failed retrieve is retried with a new grab."""
+        mock_camera = mocker.MagicMock()
+        mock_camera.grab.return_value = True
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_camera.retrieve.side_effect = [(False, None), (True, frame)]
+
+        capture = OpenCVVideoInput(camera=mock_camera)
+        result = capture.read()
+
+        assert result.shape == (480, 640, 3)
+        assert mock_camera.grab.call_count == 2
+        assert mock_camera.retrieve.call_count == 2
+
+    def test_init_with_none_parameters(self, mocker, mock_camera_factory):
         """Test initialization with None parameters."""
-        mock_camera = mocker.patch("cv2.VideoCapture")
-        mock_camera.return_value.set.return_value = True
-        mock_camera.return_value.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 1280,
-            cv2.CAP_PROP_FRAME_HEIGHT: 720,
-            cv2.CAP_PROP_FPS: 30,
-        }[prop]
+        mock_camera = mocker.patch(
+            "cv2.VideoCapture",
+            return_value=mock_camera_factory(width=1280, height=720),
+        )
 
         # Initialize with None parameters
         capture = OpenCVVideoInput(camera=0, width=None, height=None, fps=None)
@@ -229,20 +372,20 @@ class TestOpenCVVideoInput:
         assert capture.fps == 30
         assert capture.channels == 3  # Default value
 
-    def test_configure_camera_with_none_parameters(self, mocker, caplog):
+    def test_configure_camera_with_none_parameters(
+        self, mock_camera_factory, mock_warning
+    ):
         """Test configure_camera with None parameters."""
-        mock_camera = mocker.patch("cv2.VideoCapture")
-
-        # Return different values for get to simulate camera properties
-        mock_camera.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 1280,
-            cv2.CAP_PROP_FRAME_HEIGHT: 720,
-            cv2.CAP_PROP_FPS: 30,
-        }[prop]
+        mock_camera = mock_camera_factory(width=1280, height=720)
 
         # Create capture with None parameters
         capture = OpenCVVideoInput(
-            camera=mock_camera, width=None, height=None, fps=None
+            camera=mock_camera,
+            width=None,
+            height=None,
+            fps=None,
+            fourcc=None,
+            buffer_size=None,
         )
 
         # Reset mock to clear any calls from initialization
@@ -256,25 +399,13 @@ class TestOpenCVVideoInput:
         mock_camera.set.assert_not_called()
 
         # Verify no warnings were logged
-        for record in caplog.records:
-            assert "Failed to set width" not in record.message
-            assert "Failed to set height" not in record.message
-            assert "Failed to set fps" not in record.message
+        mock_warning.assert_not_called()
 
-    def test_configure_camera_with_mixed_parameters(self, mocker, caplog):
+    def test_configure_camera_with_mixed_parameters(self, mock_camera_factory):
         """Test configure_camera with a mix of None and specified
         parameters."""
-        mock_camera = mocker.MagicMock()
-
-        # Return different values for get to simulate camera properties
-        mock_camera.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FRAME_WIDTH: 1280,
-            cv2.CAP_PROP_FRAME_HEIGHT: 720,
-            cv2.CAP_PROP_FPS: 30,
-        }[prop]
-
         # Set() returns True for success
-        mock_camera.set.return_value = True
+        mock_camera = mock_camera_factory(width=1280, height=720)
 
         # Create capture with mixed parameters (width=None but height and fps specified)
         capture = OpenCVVideoInput(camera=mock_camera, width=None, height=480, fps=60)
@@ -294,3 +425,210 @@ class TestOpenCVVideoInput:
         for call in mock_camera.set.call_args_list:
             args = call[0]
             assert args[0] != cv2.CAP_PROP_FRAME_WIDTH
+
+    def test_read_drop_stale_skips_queued_frames(self, mocker):
+        """Test that queued frames are grabbed without decoding until the
+        frame interval elapses."""
+        mock_camera = mocker.MagicMock()
+        mock_camera.grab.return_value = True  # Queued frames return instantly
+        mock_camera.retrieve.return_value = (
+            True,
+            np.zeros((4, 4, 3), dtype=np.uint8),
+        )
+
+        capture = OpenCVVideoInput(camera=mock_camera, fps=1000, drop_stale=True)
+        capture.read()
+
+        assert mock_camera.grab.call_count > 1
+        mock_camera.retrieve.assert_called_once()
+
+    def test_read_drop_stale_stops_on_fresh_frame(self, mocker):
+        """Test that draining stops once a grab waits for a new frame."""
+        mock_camera = mocker.MagicMock()
+
+        def grab():
+            time.sleep(0.006)  # Longer than half the 10 ms frame interval
+            return True
+
+        mock_camera.grab.side_effect = grab
+        mock_camera.retrieve.return_value = (
+            True,
+            np.zeros((4, 4, 3), dtype=np.uint8),
+        )
+
+        capture = OpenCVVideoInput(camera=mock_camera, fps=100, drop_stale=True)
+        capture.read()
+
+        mock_camera.grab.assert_called_once()
+
+    def test_background_read_returns_latest(self, mock_camera_factory):
+        """Test that background reads return the newest captured frame."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        values = [1, 2, 3]
+        exhausted = threading.Event()
+
+        def grab():
+            if not values:
+                exhausted.set()
+                time.sleep(0.001)
+            return True
+
+        def retrieve(image=None):
+            if values:
+                image[:] = values.pop(0)
+            return True, image
+
+        mock_camera.grab.side_effect = grab
+        mock_camera.retrieve.side_effect = retrieve
+
+        with OpenCVVideoInput(
+            camera=mock_camera, background=True, reuse_buffer=True
+        ) as capture:
+            assert exhausted.wait(timeout=1.0)
+            frame = capture.read()
+
+            assert frame.shape == (2, 4, 3)
+            assert np.all(frame == 3)
+            # Without a new frame, the same frame is returned immediately
+            assert capture.read() is frame
+
+    def test_background_read_copies_without_reuse_buffer(self, mock_camera_factory):
+        """Test that background reads return new frames unless reuse_buffer is
+        set."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+
+        with OpenCVVideoInput(camera=mock_camera, background=True) as capture:
+            first = capture.read()
+            second = capture.read()
+
+        assert not np.shares_memory(first, second)
+        assert first.flags.c_contiguous
+
+    def test_background_read_does_not_allocate(self, mock_camera_factory):
+        """Test that background reads with reuse_buffer do not allocate
+        frames."""
+        mock_camera = mock_camera_factory()
+
+        # Plain functions, as mocks record every call
+        def grab():
+            time.sleep(0.001)
+            return True
+
+        mock_camera.grab = grab
+        mock_camera.retrieve = lambda image=None: (True, image)
+
+        with OpenCVVideoInput(
+            camera=mock_camera, background=True, reuse_buffer=True
+        ) as capture:
+            frame = capture.read()
+            tracemalloc.start()
+            try:
+                baseline, _ = tracemalloc.get_traced_memory()
+                for _ in range(1000):
+                    frame = capture.read()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert peak - baseline < frame.nbytes
+
+    def test_background_capture_error(self, mocker, mock_camera_factory, mock_warning):
+        """Test that capture errors are surfaced to the reader."""
+        mock_camera = mock_camera_factory()
+        mock_camera.grab.return_value = False
+        logger = logging.getLogger("pamiq_io.video.input.opencv.OpenCVVideoInput")
+        mock_error = mocker.patch.object(logger, "error")
+
+        with OpenCVVideoInput(
+            camera=mock_camera, background=True, num_trials_on_read_failure=1
+        ) as capture:
+            with pytest.raises(RuntimeError, match="Background video capture stopped"):
+                capture.read()
+
+        mock_error.assert_called_once()
+
+    def test_close(self, mock_camera_factory):
+        """Test that close stops background capture and releases the camera
+        once."""
+        mock_camera = mock_camera_factory()
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+        capture = OpenCVVideoInput(camera=mock_camera, background=True)
+        thread = capture._grabber._thread
+        assert thread.is_alive()
+
+        capture.close()
+        capture.close()
+
+        assert not thread.is_alive()
+        mock_camera.release.assert_called_once()
+        with pytest.raises(RuntimeError, match="Background video capture stopped"):
+            capture.read()
+
+    def test_background_thread_stops_on_garbage_collection(self, mock_camera_factory):
+        """Test that an unclosed background input can be garbage collected,
+        which stops the capture thread."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+        capture = OpenCVVideoInput(camera=mock_camera, background=True)
+        capture.read()
+        thread = capture._grabber._thread
+
+        del capture
+        gc.collect()
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+
+    def test_close_keeps_camera_while_grab_is_blocked(
+        self, mocker, mock_camera_factory, mock_warning
+    ):
+        """Test that close does not release the camera under a blocked
+        grab."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        grabbing = threading.Event()
+        unblock = threading.Event()
+
+        def grab():
+            grabbing.set()
+            unblock.wait()
+            return True
+
+        mock_camera.grab.side_effect = grab
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+        capture = OpenCVVideoInput(camera=mock_camera, background=True)
+        assert grabbing.wait(timeout=1.0)
+        # Let the join time out immediately
+        mocker.patch.object(capture._grabber._thread, "join")
+
+        capture.close()
+
+        mock_camera.release.assert_not_called()
+        mock_warning.assert_called_once()
+        unblock.set()
+
+    def test_background_channel_mismatch_error(
+        self, mocker, mock_camera_factory, mock_warning
+    ):
+        """Test that background reads raise channel mismatches as
+        ValueError."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        mock_camera.retrieve.return_value = (True, np.zeros((2, 4, 4), np.uint8))
+        logger = logging.getLogger("pamiq_io.video.input.opencv.OpenCVVideoInput")
+        mocker.patch.object(logger, "error")
+
+        with OpenCVVideoInput(camera=mock_camera, background=True) as capture:
+            with pytest.raises(ValueError, match="Captured frame has 4 channels"):
+                capture.read()
+
+    def test_background_does_not_allocate_rgb_buffer(self, mock_camera_factory):
+        """Test that background capture converts into its slots only."""
+        mock_camera = mock_camera_factory(width=4, height=2)
+        mock_camera.retrieve.side_effect = lambda image=None: (True, image)
+
+        with OpenCVVideoInput(
+            camera=mock_camera, background=True, reuse_buffer=True
+        ) as capture:
+            capture.read()
+
+            assert capture._rgb_buf is None
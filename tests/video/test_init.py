@@ -0,0 +1,28 @@
+"""Tests for the lazy imports of the video package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pamiq_io.video
+
+
+def test_import_does_not_load_cv2():
+    """Tests that importing the video package does not import OpenCV."""
+    code = "import sys, pamiq_io.video; assert 'cv2' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_opencv_video_input():
+    """Tests that the OpenCV input is importable from the video package."""
+    from pamiq_io.video.input.opencv import OpenCVVideoInput
+
+    assert "OpenCVVideoInput" in pamiq_io.video.__all__
+    assert pamiq_io.video.OpenCVVideoInput is OpenCVVideoInput
+
+
+def test_unknown_attribute():
+    """Tests that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        pamiq_io.video.NotAnAttribute  # noqa: B018